@@ -0,0 +1,87 @@
+"""
+Import-time budget check for building_analysis.
+
+Imports each module in a fresh interpreter and fails if it takes longer than its budget, or if it pulls in
+a heavy dependency (matplotlib, seaborn, scikit-learn, scipy) that should only load when a plotting or
+model method is first used.
+
+Usage:
+    python benchmarks/import_time.py [--repeat 5] [--scale 1.0]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+HEAVY_MODULES = ("matplotlib", "seaborn", "sklearn", "scipy")
+
+# Seconds per module. Modules that need pandas are budgeted for it; the rest must stay near-instant.
+BUDGETS = {
+    "building_analysis.cli": 0.1,
+    "building_analysis.eda": 0.1,
+    "building_analysis.model": 0.1,
+    "building_analysis.evaluator": 0.1,
+    "building_analysis.pipeline": 0.1,
+    "building_analysis.instrumentation": 0.1,
+    "building_analysis.service": 0.1,
+    "building_analysis.loader": 1.0,
+    "building_analysis.clean": 1.0,
+    "building_analysis.summary": 1.0,
+    "building_analysis.inference": 1.0,
+    "building_analysis.preprocessor": 1.0,
+    "building_analysis.validation": 1.0,
+}
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+
+def measure(module, repeat):
+    """
+    Returns the median import time of module over repeat fresh interpreters, and the heavy modules it loaded.
+    """
+    times, heavy = [], ""
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        times.append(float(output[0]))
+        heavy = output[1] if len(output) > 1 else ""
+    return statistics.median(times), heavy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per module")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget, e.g. on slow CI machines")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for module, budget in BUDGETS.items():
+        elapsed, heavy = measure(module, args.repeat)
+        budget *= args.scale
+        status = "ok"
+        if elapsed > budget:
+            status = f"OVER BUDGET ({budget:.2f}s)"
+        if heavy:
+            status = f"IMPORTS {heavy}"
+        failures += status != "ok"
+        print(f"{module:40s} {elapsed:7.3f}s  {status}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
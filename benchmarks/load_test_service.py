@@ -0,0 +1,154 @@
+"""
+Load test for the building ingestion service.
+
+Starts the service in a separate process with a synthetic inventory, then runs concurrent writer clients
+sending upsert batches (parking and lease changes) and reader clients querying the live
+aggregates. Reports upsert throughput and query latency percentiles as JSON.
+
+Usage:
+    python benchmarks/load_test_service.py [--buildings 100000] [--writers 4] [--readers 4] [--batch-size 500]
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from building_analysis.service import BuildingIngestionClient, BuildingIngestionService, LiveBuildingTable
+from building_analysis.synthetic import SyntheticBuildingDataGenerator
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+DEFAULT_REFERENCE = os.path.join(REPO_ROOT, "Datasets", "DakshitAPProject1.csv")
+QUERIES = [("region_parking", {}), ("summary", {}), ("frequencies", {"column": "Owned/Leased"})]
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _serve(records, port, ready):
+    async def main():
+        service = BuildingIngestionService(LiveBuildingTable(), port=port)
+        service.table.upsert(records)
+        await service.start()
+        ready.set()
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+def _percentiles(latencies):
+    if not latencies:
+        return {}
+    values = np.percentile(np.array(latencies) * 1000, [50, 95, 99])
+    return {"p50_ms": values[0], "p95_ms": values[1], "p99_ms": values[2], "max_ms": max(latencies) * 1000}
+
+
+def _make_batches(records, batches, batch_size, seed):
+    """
+    Builds the update batches of one writer up front, so that building them is not part of the measurement.
+    """
+    rng = np.random.default_rng(seed)
+    result = []
+    for _ in range(batches):
+        batch = []
+        for index in rng.integers(0, len(records), size=batch_size):
+            record = dict(records[index])
+            record["Total Parking Spaces"] = int(rng.integers(0, 500))
+            record["Owned/Leased"] = "OWNED" if rng.random() < 0.25 else "LEASED"
+            batch.append(record)
+        result.append(batch)
+    return result
+
+
+async def _writer(port, batches, latencies):
+    client = BuildingIngestionClient(port=port)
+    await client.connect()
+    for batch in batches:
+        start = time.perf_counter()
+        await client.upsert(batch)
+        latencies.append(time.perf_counter() - start)
+    await client.close()
+
+
+async def _reader(port, done, latencies):
+    client = BuildingIngestionClient(port=port)
+    await client.connect()
+    query = 0
+    while not done.is_set():
+        op, fields = QUERIES[query % len(QUERIES)]
+        start = time.perf_counter()
+        await client.request(op, **fields)
+        latencies.setdefault(op, []).append(time.perf_counter() - start)
+        query += 1
+    await client.close()
+
+
+async def _load(port, records, args):
+    upsert_latencies, query_latencies, done = [], {}, asyncio.Event()
+    writer_batches = [_make_batches(records, args.batches, args.batch_size, seed) for seed in range(args.writers)]
+    readers = [asyncio.create_task(_reader(port, done, query_latencies)) for _ in range(args.readers)]
+    start = time.perf_counter()
+    await asyncio.gather(
+        *[_writer(port, batches, upsert_latencies) for batches in writer_batches]
+    )
+    elapsed = time.perf_counter() - start
+    done.set()
+    await asyncio.gather(*readers)
+
+    upserts = args.writers * args.batches * args.batch_size
+    return {
+        "buildings": args.buildings,
+        "writers": args.writers,
+        "readers": args.readers,
+        "batch_size": args.batch_size,
+        "upserted_records": upserts,
+        "seconds": elapsed,
+        "upserts_per_second": upserts / elapsed,
+        "upsert_batch_latency": _percentiles(upsert_latencies),
+        "query_latency": {op: _percentiles(latencies) for op, latencies in query_latencies.items()},
+        "queries": sum(len(latencies) for latencies in query_latencies.values()),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--buildings", type=int, default=100_000, help="synthetic buildings loaded at start")
+    parser.add_argument("--writers", type=int, default=4, help="concurrent upsert clients")
+    parser.add_argument("--readers", type=int, default=4, help="concurrent query clients")
+    parser.add_argument("--batches", type=int, default=50, help="upsert batches per writer")
+    parser.add_argument("--batch-size", type=int, default=500, help="records per upsert batch")
+    parser.add_argument("--reference", default=DEFAULT_REFERENCE, help="reference CSV for the synthetic data")
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    dataset = SyntheticBuildingDataGenerator(args.reference).generate(args.buildings)
+    records = json.loads(dataset.to_json(orient="records"))
+    port = _free_port()
+    ready = multiprocessing.Event()
+    server = multiprocessing.Process(target=_serve, args=(records, port, ready), daemon=True)
+    server.start()
+    try:
+        ready.wait()
+        report = asyncio.run(_load(port, records, args))
+    finally:
+        server.terminate()
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""
+Scaling benchmarks for building_analysis.
+
+Generates synthetic datasets shaped like DakshitAPProject1.csv at the requested sizes, then times and
+memory-profiles the public methods of every class. Results are written as JSON baselines that a later
+run can be compared against. A --compare run only reports regressions and writes nothing, so a regression
+is never recorded as the new baseline; rerun without --compare to update a baseline deliberately.
+
+Usage:
+    python benchmarks/run_benchmarks.py --rows 100000 1000000
+    python benchmarks/run_benchmarks.py --rows 100000 --compare benchmarks/baselines/baseline-100000.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+import sklearn
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from building_analysis.clean import BuildingDatasetCleaner
+from building_analysis.evaluator import ModelEvaluator
+from building_analysis.inference import Inference
+from building_analysis.loader import BuildingDatasetLoader
+from building_analysis.model import BuildingRegressionModel
+from building_analysis.preprocessor import BuildingDatasetPreprocessor
+from building_analysis.summary import BuildingDatasetSummary
+from building_analysis.synthetic import SyntheticBuildingDataGenerator
+from building_analysis.validation import BuildingDatasetValidator
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+DEFAULT_REFERENCE = os.path.join(REPO_ROOT, "Datasets", "DakshitAPProject1.csv")
+DEFAULT_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+# 'Location Code' is unique per row, so one-hot encoding it (as the notebook does) would make the model
+# benchmark measure the encoder's width rather than the data size.
+NUMERICAL_COLS = ["Building Age"]
+CATEGORICAL_COLS = ["Region Code", "Bldg State", "Owned/Leased"]
+TARGET = "Total Parking Spaces"
+
+
+def build_benchmarks(csv_path):
+    """
+    Returns (name, setup, call) triples. setup() builds fresh state outside the measurement and call(state)
+    is the measured method call.
+    """
+    raw = pd.read_csv(csv_path)
+    cleaner = BuildingDatasetCleaner(raw)
+    cleaner.convert_to_datetime("Construction Date")
+    cleaned = cleaner.building_dataset
+    preprocessed = BuildingDatasetPreprocessor(raw).preprocess_data()
+    split = int(len(preprocessed) * 0.8)
+    X = preprocessed[NUMERICAL_COLS + CATEGORICAL_COLS]
+    y = preprocessed[TARGET]
+    X_train, X_test, y_train, y_test = X.iloc[:split], X.iloc[split:], y.iloc[:split], y.iloc[split:]
+    fitted = BuildingRegressionModel(preprocessed).create_pipeline(NUMERICAL_COLS, CATEGORICAL_COLS)
+    fitted.fit(X_train, y_train)
+
+    def loaded():
+        loader = BuildingDatasetLoader(csv_path)
+        loader.building_dataset = raw
+        return loader
+
+    def aggregated():
+        inference = Inference(cleaned)
+        inference.aggregate_data()
+        return inference
+
+    return [
+        ("loader.load_building_dataset", lambda: BuildingDatasetLoader(csv_path), lambda s: s.load_building_dataset()),
+        ("loader.get_building_dataset", loaded, lambda s: s.get_building_dataset()),
+        ("validator.validate", lambda: BuildingDatasetValidator(raw), lambda s: s.validate()),
+        ("cleaner.fill_missing_values", lambda: BuildingDatasetCleaner(raw), lambda s: s.fill_missing_values(TARGET, method="median")),
+        ("cleaner.drop_missing_values", lambda: BuildingDatasetCleaner(raw), lambda s: s.drop_missing_values()),
+        ("cleaner.convert_to_datetime", lambda: BuildingDatasetCleaner(raw), lambda s: s.convert_to_datetime("Construction Date")),
+        ("cleaner.remove_outliers", lambda: BuildingDatasetCleaner(raw), lambda s: s.remove_outliers(TARGET, method="IQR")),
+        ("cleaner.clean_text_columns", lambda: BuildingDatasetCleaner(raw), lambda s: s.clean_text_columns("Bldg City")),
+        ("preprocessor.__init__", lambda: raw, lambda s: BuildingDatasetPreprocessor(s)),
+        ("preprocessor.preprocess_data", lambda: BuildingDatasetPreprocessor(raw), lambda s: s.preprocess_data()),
+        ("summary.dataset_shape", lambda: BuildingDatasetSummary(raw), lambda s: s.dataset_shape()),
+        ("summary.dataset_description", lambda: BuildingDatasetSummary(raw), lambda s: s.dataset_description()),
+        ("summary.missing_values", lambda: BuildingDatasetSummary(raw), lambda s: s.missing_values()),
+        ("summary.unique_value_counts", lambda: BuildingDatasetSummary(raw), lambda s: s.unique_value_counts()),
+        ("summary.correlation_matrix", lambda: BuildingDatasetSummary(raw.select_dtypes("number")), lambda s: s.correlation_matrix()),
+        ("summary.data_types", lambda: BuildingDatasetSummary(raw), lambda s: s.data_types()),
+        ("summary.sample_data", lambda: BuildingDatasetSummary(raw), lambda s: s.sample_data(5)),
+        ("summary.column_value_frequencies", lambda: BuildingDatasetSummary(raw), lambda s: s.column_value_frequencies("Bldg State")),
+        ("summary.all_column_frequencies", lambda: BuildingDatasetSummary(raw), lambda s: s.all_column_frequencies()),
+        ("inference.aggregate_data", lambda: Inference(cleaned), lambda s: s.aggregate_data()),
+        ("inference.statistical_summary", aggregated, lambda s: s.statistical_summary()),
+        ("inference.permutation_test", lambda: Inference(cleaned), lambda s: s.permutation_test("Owned/Leased", "OWNED", "LEASED", n_resamples=1000, random_state=0)),
+        ("inference.bootstrap_confidence_interval", lambda: Inference(cleaned), lambda s: s.bootstrap_confidence_interval("Owned/Leased", "OWNED", "LEASED", n_resamples=1000, random_state=0)),
+        ("model.create_pipeline", lambda: BuildingRegressionModel(preprocessed), lambda s: s.create_pipeline(NUMERICAL_COLS, CATEGORICAL_COLS)),
+        ("model.fit", lambda: BuildingRegressionModel(preprocessed).create_pipeline(NUMERICAL_COLS, CATEGORICAL_COLS), lambda s: s.fit(X_train, y_train)),
+        ("model.predict", lambda: fitted, lambda s: s.predict(X_test)),
+        ("evaluator.evaluate", ModelEvaluator, lambda s: s.evaluate(fitted, X_test, y_test)),
+    ]
+
+
+def measure(setup, call, repeat):
+    """
+    Returns the median wall and CPU time over repeat runs, and the peak traced memory of one extra run.
+    Memory is measured separately because tracing slows the code down.
+    """
+    wall, cpu = [], []
+    for _ in range(repeat):
+        state = setup()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        call(state)
+        wall.append(time.perf_counter() - wall_start)
+        cpu.append(time.process_time() - cpu_start)
+
+    state = setup()
+    tracemalloc.start()
+    call(state)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "wall_seconds": statistics.median(wall),
+        "cpu_seconds": statistics.median(cpu),
+        "peak_memory_bytes": peak,
+        "repeat": repeat,
+    }
+
+
+def run(rows, reference, repeat, seed, workdir):
+    csv_path = os.path.join(workdir, f"synthetic-{rows}.csv")
+    generator = SyntheticBuildingDataGenerator(reference, random_state=seed)
+    start = time.perf_counter()
+    generator.write_csv(csv_path, rows)
+    print(f"Generated {rows} rows in {time.perf_counter() - start:.2f}s")
+
+    results = {}
+    for name, setup, call in build_benchmarks(csv_path):
+        results[name] = measure(setup, call, repeat)
+        print(f"  {name:45s} {results[name]['wall_seconds']:9.4f}s {results[name]['peak_memory_bytes'] / 2**20:10.1f} MiB")
+    return {
+        "rows": rows,
+        "seed": seed,
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "sklearn": sklearn.__version__,
+        },
+        "results": results,
+    }
+
+
+# Absolute changes below these are treated as noise, whatever the relative change.
+NOISE_FLOOR = {"wall_seconds": 0.005, "peak_memory_bytes": 2 ** 20}
+
+
+def compare(current, baseline, tolerance):
+    """
+    Returns the benchmarks whose wall time or peak memory grew by more than tolerance over the baseline.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        for metric, floor in NOISE_FLOOR.items():
+            before, after = baseline["results"][name][metric], result[metric]
+            if after - before <= floor:
+                continue
+            if before == 0:
+                regressions.append(f"{name} {metric}: {before:.6g} -> {after:.6g} (up from zero)")
+            elif (after - before) / before > tolerance:
+                regressions.append(f"{name} {metric}: {before:.6g} -> {after:.6g} (+{(after - before) / before:.0%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000], help="dataset sizes, e.g. 100000 1000000 10000000")
+    parser.add_argument("--reference", default=DEFAULT_REFERENCE, help="reference CSV for the synthetic data")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="synthetic data seed")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="where baseline JSON files are written")
+    parser.add_argument(
+        "--compare", help="baseline JSON file to compare against (single --rows value); no baseline is written"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression, default 0.2")
+    args = parser.parse_args(argv)
+    if args.compare and len(args.rows) > 1:
+        parser.error("--compare takes a single --rows value")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+    else:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    regressions = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in args.rows:
+            report = run(rows, args.reference, args.repeat, args.seed, workdir)
+            if baseline is not None:
+                regressions += compare(report, baseline, args.tolerance)
+                continue
+            output_path = os.path.join(args.output_dir, f"baseline-{rows}.json")
+            with open(output_path, "w") as handle:
+                json.dump(report, handle, indent=2, sort_keys=True)
+            print(f"Wrote {output_path}")
+
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
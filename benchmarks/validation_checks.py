@@ -0,0 +1,98 @@
+"""
+Regression checks for the validation stage on the GSA inventory.
+
+This is not a benchmark: it is the test entry point for building_analysis.validation, kept next to the
+other standalone check scripts (e.g. import_time.py) since the repository has no test suite. It exits
+with status 1 if any check fails.
+
+Each check edits a copy of the reference CSV, reloads it with BuildingDatasetLoader as the pipeline does,
+and verifies that only the edited rows are quarantined.
+
+Usage:
+    python benchmarks/validation_checks.py [--reference Datasets/DakshitAPProject1.csv]
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from building_analysis.loader import BuildingDatasetLoader
+from building_analysis.validation import BuildingDatasetValidator
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+DEFAULT_REFERENCE = os.path.join(REPO_ROOT, "Datasets", "DakshitAPProject1.csv")
+
+
+def _validate_edited(reference, edit):
+    """
+    Applies edit to a copy of the reference CSV, reloads it and validates it. Returns the validator and
+    the number of rows of the unedited file that are quarantined.
+    """
+    original = pd.read_csv(reference)
+    baseline = BuildingDatasetValidator(original)
+    baseline.validate()
+    edited = original.copy()
+    edit(edited)
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "edited.csv")
+        edited.to_csv(path, index=False)
+        loaded = BuildingDatasetLoader(path).load_building_dataset()
+    validator = BuildingDatasetValidator(loaded)
+    validator.validate()
+    return validator, len(baseline.quarantined_dataset)
+
+
+def check_blank_zip(reference):
+    """
+    One blank 'Bldg Zip' makes pandas read the column as float; only that row may fail zip_format.
+    """
+    def edit(dataset):
+        dataset.loc[0, "Bldg Zip"] = np.nan
+
+    validator, quarantined_before = _validate_edited(reference, edit)
+    zip_errors = validator.errors[validator.errors["rule"] == "zip_format"]
+    assert list(zip_errors["row"]) == [0], f"zip_format failed on {len(zip_errors)} rows, expected row 0 only"
+    assert len(validator.quarantined_dataset) <= quarantined_before + 1
+
+
+def check_missing_parking(reference):
+    """
+    Missing 'Total Parking Spaces' are left for the cleaning stage to impute; only negative counts fail.
+    """
+    def edit(dataset):
+        dataset.loc[[0, 1], "Total Parking Spaces"] = np.nan
+        dataset.loc[2, "Total Parking Spaces"] = -1
+
+    validator, _ = _validate_edited(reference, edit)
+    parking_errors = validator.errors[validator.errors["rule"] == "non_negative"]
+    assert list(parking_errors["row"]) == [2], f"non_negative failed on rows {list(parking_errors['row'])}, expected [2]"
+    assert {0, 1} <= set(validator.valid_dataset.index), "rows with missing parking were quarantined"
+
+
+CHECKS = [check_blank_zip, check_missing_parking]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--reference", default=DEFAULT_REFERENCE, help="reference CSV to edit")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for check in CHECKS:
+        try:
+            check(args.reference)
+            status = "ok"
+        except AssertionError as e:
+            status = f"FAILED: {e}"
+            failures += 1
+        print(f"{check.__name__:40s} {status}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
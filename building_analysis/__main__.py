@@ -0,0 +1,5 @@
+import sys
+
+from building_analysis.cli import main
+
+sys.exit(main())
@@ -1,7 +1,11 @@
 import numpy as np
 import pandas as pd
 
+from building_analysis.dataset import as_handle
+from building_analysis.instrumentation import instrument_class
 
+
+@instrument_class
 class BuildingDatasetCleaner:
     """
     This class is designed for cleaning the building dataset.
@@ -22,12 +26,22 @@ class BuildingDatasetCleaner:
         """
         Initializes the BuildingDatasetCleaner with the provided dataset.
 
+        The cleaner never modifies the caller's frame: changes are applied copy-on-write through a
+        DatasetHandle, so only the columns it changes are copied.
+
         Parameters:
         ----------
-        dataset : DataFrame
+        dataset : DataFrame or DatasetHandle
             The building dataset loaded from a CSV file.
         """
-        self.building_dataset = dataset
+        self.handle = as_handle(dataset)
+
+    @property
+    def building_dataset(self):
+        """
+        The cleaned dataset in its current state.
+        """
+        return self.handle.frame
 
     def fill_missing_values(self, column_name, method="mean"):
         """
@@ -52,13 +66,13 @@ class BuildingDatasetCleaner:
         else:
             return "Invalid method. Please choose 'mean', 'median', or 'mode'."
 
-        self.building_dataset[column_name].fillna(fill_value, inplace=True)
+        self.handle.set_column(column_name, self.building_dataset[column_name].fillna(fill_value))
 
     def drop_missing_values(self):
         """
         Drops rows with any missing values in the dataset.
         """
-        self.building_dataset.dropna(inplace=True)
+        self.handle.filter_rows(self.building_dataset.notna().all(axis=1))
 
     def convert_to_datetime(self, column_name, format_string="%d-%b-%Y"):
         """
@@ -72,8 +86,8 @@ class BuildingDatasetCleaner:
             The format string to use for the conversion. Default is '%d-%b-%Y'.
         """
         try:
-            self.building_dataset[column_name] = pd.to_datetime(
-                self.building_dataset[column_name], format=format_string
+            self.handle.set_column(
+                column_name, pd.to_datetime(self.building_dataset[column_name], format=format_string)
             )
         except ValueError as e:
             return f"Conversion error: {e}"
@@ -98,16 +112,16 @@ class BuildingDatasetCleaner:
             IQR = Q3 - Q1
             lower_bound = Q1 - 1.5 * IQR
             upper_bound = Q3 + 1.5 * IQR
-            self.building_dataset = self.building_dataset[
+            self.handle.filter_rows(
                 (self.building_dataset[column_name] >= lower_bound)
                 & (self.building_dataset[column_name] <= upper_bound)
-            ]
+            )
         elif method == "Z-score":
             from scipy import stats
 
             z_scores = stats.zscore(self.building_dataset[column_name])
             abs_z_scores = np.abs(z_scores)
-            self.building_dataset = self.building_dataset[(abs_z_scores < 3)]
+            self.handle.filter_rows(abs_z_scores < 3)
         else:
             return "Invalid method. Please choose 'IQR' or 'Z-score'."
 
@@ -123,14 +137,7 @@ class BuildingDatasetCleaner:
         if column_name not in self.building_dataset.columns:
             return f"Column '{column_name}' not found in the dataset."
 
-        self.building_dataset[column_name] = self.building_dataset[
-            column_name
-        ].str.strip()  # Remove leading/trailing whitespace
-        self.building_dataset[column_name] = self.building_dataset[
-            column_name
-        ].str.lower()  # Convert to lowercase
-        self.building_dataset[column_name] = self.building_dataset[
-            column_name
-        ].str.replace(
-            "[^\w\s]", ""
-        )  # Remove special chars
+        cleaned = self.building_dataset[column_name].str.strip()  # Remove leading/trailing whitespace
+        cleaned = cleaned.str.lower()  # Convert to lowercase
+        cleaned = cleaned.str.replace(r"[^\w\s]", "", regex=True)  # Remove special chars
+        self.handle.set_column(column_name, cleaned)
@@ -0,0 +1,228 @@
+"""
+Command-line entry point for batch jobs: building-analysis load|validate|clean|summarize|aggregate|train|score|serve.
+
+Only argparse is imported at start-up; each command imports the modules it needs, so that e.g.
+'aggregate' never loads matplotlib or scikit-learn.
+"""
+import argparse
+import os
+import sys
+
+DEFAULT_NUMERICAL_COLS = ["Building Age"]
+DEFAULT_CATEGORICAL_COLS = ["Location Code", "Region Code", "Bldg City", "Bldg County", "Bldg State", "Owned/Leased"]
+DEFAULT_TARGET = "Total Parking Spaces"
+
+
+def _load(file_path):
+    from building_analysis.loader import BuildingDatasetLoader
+
+    dataset = BuildingDatasetLoader(file_path).load_building_dataset()
+    if isinstance(dataset, str):
+        raise SystemExit(dataset)
+    return dataset
+
+
+def _write(frame, output, index=False):
+    if output:
+        frame.to_csv(output, index=index)
+    else:
+        frame.to_csv(sys.stdout, index=index)
+
+
+def load(args):
+    dataset = _load(args.input)
+    print(f"Loaded {dataset.shape[0]} rows x {dataset.shape[1]} columns from {args.input}")
+    if args.output:
+        _write(dataset, args.output)
+
+
+def validate(args):
+    from building_analysis.validation import BuildingDatasetValidator
+
+    validator = BuildingDatasetValidator(_load(args.input))
+    valid_dataset = validator.validate(n_jobs=args.jobs)
+    print(validator.error_summary().to_string(index=False), file=sys.stderr)
+    print(f"{len(valid_dataset)} valid rows, {len(validator.quarantined_dataset)} quarantined", file=sys.stderr)
+    if args.errors:
+        validator.errors.to_csv(args.errors, index=False)
+    if args.quarantine:
+        validator.quarantined_dataset.to_csv(args.quarantine, index=False)
+    _write(valid_dataset, args.output)
+
+
+def clean(args):
+    from building_analysis.clean import BuildingDatasetCleaner
+
+    cleaner = BuildingDatasetCleaner(_load(args.input))
+    for message in (
+        cleaner.fill_missing_values(args.fill_column, method=args.fill_method),
+        cleaner.drop_missing_values(),
+        cleaner.remove_outliers(args.outlier_column, method=args.outlier_method),
+        *[cleaner.clean_text_columns(column) for column in args.text_columns],
+        cleaner.convert_to_datetime(args.date_column),
+    ):
+        if message:
+            print(message, file=sys.stderr)
+    _write(cleaner.building_dataset, args.output)
+
+
+def summarize(args):
+    from building_analysis.summary import BuildingDatasetSummary
+
+    summary = BuildingDatasetSummary(_load(args.input))
+    rows, columns = summary.dataset_shape()
+    print(f"Shape: {rows} rows x {columns} columns")
+    print(f"\nMissing values:\n{summary.missing_values().to_string()}")
+    print("\nUnique values:")
+    for column, count in summary.unique_value_counts().items():
+        print(f"{column}: {count}")
+
+
+def aggregate(args):
+    from building_analysis.inference import Inference
+
+    _write(Inference(_load(args.input)).aggregate_data(), args.output)
+
+
+def _features(args):
+    from building_analysis.preprocessor import BuildingDatasetPreprocessor
+
+    dataset = BuildingDatasetPreprocessor(_load(args.input)).preprocess_data()
+    return dataset, dataset[args.numerical + args.categorical]
+
+
+def train(args):
+    import pickle
+
+    from sklearn.model_selection import train_test_split
+
+    from building_analysis.evaluator import ModelEvaluator
+    from building_analysis.model import BuildingRegressionModel
+
+    dataset, X = _features(args)
+    y = dataset[args.target]
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=args.test_size, random_state=args.random_state
+    )
+    pipeline = BuildingRegressionModel(dataset).create_pipeline(args.numerical, args.categorical)
+    pipeline.fit(X_train, y_train)
+    mse, r2 = ModelEvaluator().evaluate(pipeline, X_test, y_test)
+    print(f"MSE: {mse}, R-squared: {r2}")
+
+    saved = {
+        "pipeline": pipeline,
+        "numerical_cols": args.numerical,
+        "categorical_cols": args.categorical,
+        "target": args.target,
+    }
+    with open(args.model, "wb") as handle:
+        pickle.dump(saved, handle)
+
+
+def score(args):
+    import pickle
+
+    with open(args.model, "rb") as handle:
+        saved = pickle.load(handle)
+    args.numerical, args.categorical = saved["numerical_cols"], saved["categorical_cols"]
+    dataset, X = _features(args)
+
+    if saved["target"] in dataset.columns:
+        from building_analysis.evaluator import ModelEvaluator
+
+        mse, r2 = ModelEvaluator().evaluate(saved["pipeline"], X, dataset[saved["target"]])
+        print(f"MSE: {mse}, R-squared: {r2}", file=sys.stderr)
+    if args.output:
+        predictions = dataset[[]].assign(**{f"Predicted {saved['target']}": saved["pipeline"].predict(X)})
+        _write(predictions, args.output, index=True)
+
+
+def serve(args):
+    import asyncio
+
+    from building_analysis.service import BuildingIngestionService, LiveBuildingTable
+
+    table = LiveBuildingTable.from_frame(_load(args.input)) if args.input else LiveBuildingTable()
+    service = BuildingIngestionService(table, host=args.host, port=args.port)
+    print(f"Serving {table.shape()[0]} buildings on {args.host}:{args.port}", file=sys.stderr)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="building-analysis", description="Batch analysis of the building dataset.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("load", help="load a dataset and report its shape")
+    command.add_argument("input", help="building dataset CSV")
+    command.add_argument("--output", help="write the loaded dataset to this CSV")
+    command.set_defaults(func=load)
+
+    command = commands.add_parser("validate", help="check the dataset against the schema rules and quarantine bad rows")
+    command.add_argument("input", help="building dataset CSV")
+    command.add_argument("--output", help="valid rows CSV (default: stdout)")
+    command.add_argument("--errors", help="write the error table (row, column, rule, severity) to this CSV")
+    command.add_argument("--quarantine", help="write the quarantined rows to this CSV")
+    command.add_argument("--jobs", type=int, default=1, help="worker processes checking chunks")
+    command.set_defaults(func=validate)
+
+    command = commands.add_parser("clean", help="clean a dataset as in the notebook")
+    command.add_argument("input", help="building dataset CSV")
+    command.add_argument("--output", help="cleaned CSV (default: stdout)")
+    command.add_argument("--fill-column", default=DEFAULT_TARGET)
+    command.add_argument("--fill-method", default="median", choices=["mean", "median", "mode"])
+    command.add_argument("--outlier-column", default=DEFAULT_TARGET)
+    command.add_argument("--outlier-method", default="IQR", choices=["IQR", "Z-score"])
+    command.add_argument("--text-columns", nargs="*", default=["Bldg City"])
+    command.add_argument("--date-column", default="Construction Date")
+    command.set_defaults(func=clean)
+
+    command = commands.add_parser("summarize", help="print shape, missing values and unique value counts")
+    command.add_argument("input", help="building dataset CSV")
+    command.set_defaults(func=summarize)
+
+    command = commands.add_parser("aggregate", help="average parking spaces by region")
+    command.add_argument("input", help="building dataset CSV")
+    command.add_argument("--output", help="aggregate CSV (default: stdout)")
+    command.set_defaults(func=aggregate)
+
+    command = commands.add_parser("train", help="fit and evaluate the regression model, then save it")
+    command.add_argument("input", help="cleaned building dataset CSV")
+    command.add_argument("--model", required=True, help="where to save the fitted model")
+    command.add_argument("--numerical", nargs="*", default=DEFAULT_NUMERICAL_COLS)
+    command.add_argument("--categorical", nargs="*", default=DEFAULT_CATEGORICAL_COLS)
+    command.add_argument("--target", default=DEFAULT_TARGET)
+    command.add_argument("--test-size", type=float, default=0.2)
+    command.add_argument("--random-state", type=int, default=42)
+    command.set_defaults(func=train)
+
+    command = commands.add_parser("score", help="predict with a saved model (and evaluate if the target is present)")
+    command.add_argument("input", help="building dataset CSV")
+    command.add_argument("--model", required=True, help="model saved by 'train'")
+    command.add_argument("--output", help="write predictions to this CSV")
+    command.set_defaults(func=score)
+
+    command = commands.add_parser("serve", help="run the live ingestion service")
+    command.add_argument("input", nargs="?", help="building dataset CSV to start from")
+    command.add_argument("--host", default="127.0.0.1")
+    command.add_argument("--port", type=int, default=8765)
+    command.set_defaults(func=serve)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        args.func(args)
+    except BrokenPipeError:
+        # Output was piped into e.g. 'head'; silence the error Python raises when flushing stdout at exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+class DatasetHandle:
+    """
+    A copy-on-write handle to a building dataset, shared by the pipeline classes.
+
+    The handle never modifies the frame it was created from. Changing a column replaces just that column
+    in a shallow copy of the frame, so the other columns keep sharing memory with the original; filtering
+    rows creates the filtered frame. Read-only consumers (summary, EDA, inference) get zero-copy views.
+
+    Attributes:
+    ----------
+    changed_columns : set of str
+        The columns this handle has written, i.e. the only columns it has materialized.
+
+    Usage:
+        handle = DatasetHandle(loaded_dataset)
+        cleaner = BuildingDatasetCleaner(handle)
+        cleaner.convert_to_datetime('Construction Date')   # loaded_dataset is left untouched
+        summary = BuildingDatasetSummary(handle)           # no copy
+    """
+
+    def __init__(self, dataset):
+        """
+        Initializes the handle without copying the dataset.
+
+        Parameters:
+        ----------
+        dataset : DataFrame or DatasetHandle
+            The building dataset. A handle is forked, so the two evolve independently.
+        """
+        if isinstance(dataset, DatasetHandle):
+            dataset = dataset._frame
+        self._frame = dataset
+        self.changed_columns = set()
+
+    @property
+    def frame(self):
+        """
+        The current state of the dataset. Treat it as read-only; change it through the handle.
+        """
+        return self._frame
+
+    @property
+    def columns(self):
+        return self._frame.columns
+
+    @property
+    def shape(self):
+        return self._frame.shape
+
+    def view(self):
+        """
+        Returns a zero-copy view of the dataset for read-only work.
+
+        The view is a shallow copy: it shares every column with the handle, and columns added to it do not
+        leak back into the handle or the original frame.
+
+        Returns:
+        -------
+        DataFrame
+            A shallow copy of the current dataset.
+        """
+        return self._frame.copy(deep=False)
+
+    def fork(self):
+        """
+        Returns a new handle on the current dataset, without copying any data.
+        """
+        return DatasetHandle(self)
+
+    def set_column(self, column_name, values):
+        """
+        Replaces (or adds) a single column, copying nothing but that column.
+
+        Parameters:
+        ----------
+        column_name : str
+            The name of the column to set.
+        values : Series or array-like
+            The new column values, aligned with the current rows.
+        """
+        frame = self._frame.copy(deep=False)
+        # Full-column assignment replaces the column's array (pandas >= 1.5), so the shared
+        # arrays of the original frame are never written to.
+        frame[column_name] = values
+        self._frame = frame
+        self.changed_columns.add(column_name)
+
+    def filter_rows(self, mask):
+        """
+        Keeps only the rows where mask is True. Does nothing (and copies nothing) if every row is kept.
+
+        Parameters:
+        ----------
+        mask : Series of bool
+            A boolean mask aligned with the current rows.
+        """
+        if not mask.all():
+            self._frame = self._frame[mask]
+
+    def materialize(self):
+        """
+        Returns a fully owned deep copy of the dataset, for callers that need to modify it freely.
+        """
+        return self._frame.copy(deep=True)
+
+
+def as_handle(dataset):
+    """
+    Returns dataset if it is already a DatasetHandle, otherwise wraps the DataFrame in one without copying it.
+    """
+    if isinstance(dataset, DatasetHandle):
+        return dataset
+    return DatasetHandle(dataset)
+
+
+def read_only_view(dataset):
+    """
+    Returns a zero-copy view of a DataFrame or DatasetHandle for read-only work.
+    """
+    return as_handle(dataset).view()
@@ -1,14 +1,15 @@
-from matplotlib import pyplot as plt
-import seaborn as sns
+from building_analysis.dataset import read_only_view
+from building_analysis.instrumentation import instrument_class
 
 
+@instrument_class
 class BuildingDatasetEDA:
     """
     A simplified class for performing basic Exploratory Data Analysis (EDA) on the building dataset.
     """
 
     def __init__(self, dataset):
-        self.dataset = dataset
+        self.dataset = read_only_view(dataset)
 
     def plot_histogram(self, column_name):
         """
@@ -18,6 +19,8 @@ class BuildingDatasetEDA:
         column_name : str
             The name of the numeric column for which to generate the histogram.
         """
+        from matplotlib import pyplot as plt
+
         if column_name in self.dataset.columns:
             self.dataset[column_name].hist()
             plt.title(f"Histogram of {column_name}")
@@ -35,6 +38,8 @@ class BuildingDatasetEDA:
         column_name : str
             The name of the categorical column for which to generate the bar chart.
         """
+        from matplotlib import pyplot as plt
+
         if column_name in self.dataset.columns:
             value_counts = self.dataset[column_name].value_counts()
             value_counts.plot(kind="bar")
@@ -53,6 +58,8 @@ class BuildingDatasetEDA:
         column_name : str
             The name of the numeric column for which to generate the boxplot.
         """
+        from matplotlib import pyplot as plt
+
         if column_name in self.dataset.columns:
             self.dataset.boxplot(column=column_name)
             plt.title(f"Boxplot of {column_name}")
@@ -69,6 +76,8 @@ class BuildingDatasetEDA:
         column_x, column_y : str
             The names of the numeric columns to use for the x and y axes of the scatterplot.
         """
+        from matplotlib import pyplot as plt
+
         if column_x in self.dataset.columns and column_y in self.dataset.columns:
             self.dataset.plot.scatter(x=column_x, y=column_y)
             plt.title(f"Scatterplot of {column_x} vs {column_y}")
@@ -81,6 +90,8 @@ class BuildingDatasetEDA:
             )
 
     def plot_pie_chart(self, column_name):
+        from matplotlib import pyplot as plt
+
         if column_name in self.dataset.columns:
             pie_data = self.dataset[column_name].value_counts()
             pie_data.plot(kind="pie", autopct="%1.1f%%")
@@ -91,6 +102,8 @@ class BuildingDatasetEDA:
             print(f"Column '{column_name}' not found in the dataset.")
 
     def plot_line_graph(self, column_name):
+        from matplotlib import pyplot as plt
+
         if column_name in self.dataset.columns:
             self.dataset[column_name].plot(kind="line")
             plt.title(f"Line Graph of {column_name}")
@@ -100,6 +113,9 @@ class BuildingDatasetEDA:
             print(f"Column '{column_name}' not found in the dataset.")
 
     def plot_countplot(self, column_name):
+        from matplotlib import pyplot as plt
+        import seaborn as sns
+
         if column_name in self.dataset.columns:
             sns.countplot(x=column_name, data=self.dataset)
             plt.title(f"Count Plot of {column_name}")
@@ -109,6 +125,9 @@ class BuildingDatasetEDA:
             print(f"Column '{column_name}' not found in the dataset.")
 
     def plot_correlation_heatmap(self):
+        from matplotlib import pyplot as plt
+        import seaborn as sns
+
         correlation_matrix = self.dataset.corr()
         sns.heatmap(correlation_matrix, annot=True, cmap="coolwarm")
         plt.title("Correlation Heatmap")
@@ -1,5 +1,6 @@
-from sklearn.metrics import mean_squared_error, r2_score
+from building_analysis.instrumentation import instrument_class
 
+@instrument_class
 class ModelEvaluator:
     """
     ModelEvaluator - A library for evaluating regression models using common metrics.
@@ -45,6 +46,8 @@ class ModelEvaluator:
         Returns:
             tuple: A tuple containing Mean Squared Error (MSE) and R-squared (R2) scores.
         """
+        from sklearn.metrics import mean_squared_error, r2_score
+
         # Make predictions
         y_pred = model.predict(X_test)
 
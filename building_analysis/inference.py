@@ -1,8 +1,18 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 
+from building_analysis import resampling
+from building_analysis.dataset import read_only_view
+from building_analysis.instrumentation import instrument_class
 
+# 'Historical Status' values that count as historic when comparing historic vs non-historic buildings.
+HISTORIC_STATUSES = [
+    "National Register Listed",
+    "National Register Eligible",
+    "National Historic Landmark",
+]
+
+
+@instrument_class
 class Inference:
     """
     A class used to perform data aggregation, statistical analysis, and visualization on a dataset
@@ -20,11 +30,12 @@ class Inference:
 
         Parameters:
         ----------
-        data : DataFrame
-            A Pandas DataFrame that contains the data for analysis and visualization.
+        data : DataFrame or DatasetHandle
+            A Pandas DataFrame that contains the data for analysis and visualization. Only a zero-copy
+            view of it is kept, so the caller's frame is never modified.
         """
 
-        self.data = data
+        self.data = read_only_view(data)
 
     def aggregate_data(self):
         """
@@ -55,6 +66,124 @@ class Inference:
         """
         return self.region_parking.describe()
 
+    def _group_values(self, group_column, group_a, group_b, value_column):
+        """
+        Splits value_column into two groups by the values of group_column.
+
+        group_a and group_b may be a single value or a list of values. If group_b is None, every row
+        not in group_a forms the second group.
+        """
+        missing = [col for col in (group_column, value_column) if col not in self.data.columns]
+        if missing:
+            raise ValueError(f"Missing columns in the dataset: {missing}")
+
+        as_list = lambda group: group if isinstance(group, (list, tuple, set)) else [group]
+        in_a = self.data[group_column].isin(as_list(group_a))
+        in_b = ~in_a if group_b is None else self.data[group_column].isin(as_list(group_b))
+        values = self.data[value_column]
+        return values[in_a].dropna().to_numpy(), values[in_b].dropna().to_numpy()
+
+    def permutation_test(
+        self,
+        group_column,
+        group_a,
+        group_b=None,
+        value_column="Total Parking Spaces",
+        statistic="mean",
+        n_resamples=10000,
+        random_state=None,
+        n_jobs=1,
+    ):
+        """
+        Tests whether the difference in the mean or median of value_column between two groups is real,
+        using a two-sided permutation test.
+
+        Examples: region vs region (group_column='Region Code', group_a=4, group_b=7), owned vs leased
+        (group_column='Owned/Leased', group_a='OWNED', group_b='LEASED'), historic vs non-historic
+        (group_column='Historical Status', group_a=HISTORIC_STATUSES).
+
+        Parameters:
+        ----------
+        group_column : str
+            The column that defines the groups.
+        group_a : value or list
+            The value(s) of group_column in the first group.
+        group_b : value, list or None, optional
+            The value(s) of group_column in the second group. If None, all remaining rows.
+        value_column : str, optional
+            The numeric column to compare. Default is 'Total Parking Spaces'.
+        statistic : str, optional
+            'mean' or 'median'. Default is 'mean'.
+        n_resamples : int, optional
+            The number of permutations. Default is 10000.
+        random_state : int or None, optional
+            Seed for reproducible results.
+        n_jobs : int, optional
+            Number of worker processes; -1 uses every CPU. Default is 1.
+
+        Returns:
+        -------
+        dict
+            The observed difference (group_a - group_b), the two-sided p-value and the number of resamples.
+        """
+        a, b = self._group_values(group_column, group_a, group_b, value_column)
+        return resampling.permutation_test(
+            a, b, statistic=statistic, n_resamples=n_resamples, random_state=random_state, n_jobs=n_jobs
+        )
+
+    def bootstrap_confidence_interval(
+        self,
+        group_column,
+        group_a,
+        group_b=None,
+        value_column="Total Parking Spaces",
+        statistic="mean",
+        n_resamples=10000,
+        confidence_level=0.95,
+        random_state=None,
+        n_jobs=1,
+    ):
+        """
+        Computes a percentile bootstrap confidence interval for the difference in the mean or median of
+        value_column between two groups. Groups are selected as in permutation_test.
+
+        Parameters:
+        ----------
+        group_column : str
+            The column that defines the groups.
+        group_a : value or list
+            The value(s) of group_column in the first group.
+        group_b : value, list or None, optional
+            The value(s) of group_column in the second group. If None, all remaining rows.
+        value_column : str, optional
+            The numeric column to compare. Default is 'Total Parking Spaces'.
+        statistic : str, optional
+            'mean' or 'median'. Default is 'mean'.
+        n_resamples : int, optional
+            The number of bootstrap samples. Default is 10000.
+        confidence_level : float, optional
+            The confidence level of the interval. Default is 0.95.
+        random_state : int or None, optional
+            Seed for reproducible results.
+        n_jobs : int, optional
+            Number of worker processes; -1 uses every CPU. Default is 1.
+
+        Returns:
+        -------
+        dict
+            The observed difference (group_a - group_b) and the lower and upper bounds of the interval.
+        """
+        a, b = self._group_values(group_column, group_a, group_b, value_column)
+        return resampling.bootstrap_confidence_interval(
+            a,
+            b,
+            statistic=statistic,
+            n_resamples=n_resamples,
+            confidence_level=confidence_level,
+            random_state=random_state,
+            n_jobs=n_jobs,
+        )
+
     def visualize_matplotlib(self):
         """
         Visualizes the average 'Total Parking Spaces' by 'Region Code' using a Matplotlib bar chart.
@@ -62,6 +191,8 @@ class Inference:
         The visualization is displayed as a 10x6 figure with 'Region Code' on the x-axis and
         'Average Total Parking Spaces' on the y-axis.
         """
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(10, 6))
         plt.bar(
             self.region_parking["Region Code"],
@@ -79,6 +210,9 @@ class Inference:
         The visualization is displayed as a 10x6 figure with 'Region Code' on the x-axis and
         'Average Total Parking Spaces' on the y-axis, leveraging the advanced styling capabilities of Seaborn.
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         plt.figure(figsize=(10, 6))
         sns.barplot(x="Region Code", y="Total Parking Spaces", data=self.region_parking)
         plt.xlabel("Region Code")
@@ -96,6 +230,9 @@ class Inference:
         The heatmap is displayed as a 12x8 figure with annotations, using a 'viridis' colormap to represent
         the magnitude of the values.
         """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         self.data["Construction Year"] = pd.to_datetime(
             self.data["Construction Date"]
         ).dt.year
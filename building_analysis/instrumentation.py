@@ -0,0 +1,311 @@
+"""
+Opt-in timing and memory instrumentation for the building_analysis classes.
+
+Every class in the package is decorated with instrument_class, which wraps __init__ and the public
+methods. While instrumentation is disabled (the default) a wrapped call costs one global lookup. Once
+enabled, each call produces a record with its wall time, CPU time, peak memory delta and the row and
+column counts of its input and output frames, which is passed to a sink.
+
+Usage:
+    from building_analysis import instrumentation
+
+    aggregator = instrumentation.InMemoryAggregator()
+    with instrumentation.instrumented(aggregator):
+        BuildingDatasetPreprocessor(dataset).preprocess_data()
+    print(aggregator.summary())
+"""
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+# Instance attributes that hold the frame a class works on, in lookup order.
+FRAME_ATTRIBUTES = ("building_dataset", "dataset", "data")
+
+_sink = None
+_track_memory = False
+_started_tracing = False
+# Peak memory seen so far by every instrumented call in progress, in any thread, keyed by a per-call token.
+_active_peaks = {}
+_peaks_lock = threading.Lock()
+
+
+def _shape(obj):
+    """
+    Returns (rows, columns) for a DataFrame or Series, and None for anything else.
+    """
+    shape = getattr(obj, "shape", None)
+    if shape is None or (not hasattr(obj, "columns") and not hasattr(obj, "name")):
+        return None
+    return (shape[0], shape[1] if len(shape) > 1 else 1)
+
+
+def _instance_shape(instance):
+    for attribute in FRAME_ATTRIBUTES:
+        shape = _shape(getattr(instance, attribute, None))
+        if shape is not None:
+            return shape
+    return None
+
+
+def _input_shape(args, kwargs):
+    for value in list(args[1:]) + list(kwargs.values()):
+        shape = _shape(value)
+        if shape is not None:
+            return shape
+    return _instance_shape(args[0]) if args else None
+
+
+def _record(name, func, args, kwargs):
+    sink, track_memory = _sink, _track_memory
+    input_shape = _input_shape(args, kwargs)
+
+    if track_memory:
+        # tracemalloc has a single, process-wide peak counter. Before resetting it, the peak reached so far
+        # is folded into the entry of every call in progress, in this thread (callers) or others, so that
+        # no call loses the peak it has seen. Allocations are not attributed to threads, so calls running
+        # concurrently also count each other's allocations.
+        token = object()
+        with _peaks_lock:
+            current, peak = tracemalloc.get_traced_memory()
+            for other in _active_peaks:
+                _active_peaks[other] = max(_active_peaks[other], peak)
+            _active_peaks[token] = 0
+            tracemalloc.reset_peak()
+
+    error = None
+    start_ns, cpu_start, wall_start = time.time_ns(), time.thread_time(), time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+        return result
+    except BaseException as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        memory_delta = None
+        if track_memory:
+            with _peaks_lock:
+                peak = max(_active_peaks.pop(token), tracemalloc.get_traced_memory()[1])
+            memory_delta = peak - current
+
+        output_shape = None
+        if error is None:
+            output_shape = _shape(result)
+            # In-place methods and __init__ return None; their output is the frame they leave on the instance.
+            if result is None and args:
+                output_shape = _instance_shape(args[0])
+
+        sink.emit(
+            {
+                "name": name,
+                "start_ns": start_ns,
+                "wall_seconds": wall,
+                "cpu_seconds": cpu,
+                "peak_memory_delta_bytes": memory_delta,
+                "rows_in": input_shape[0] if input_shape else None,
+                "columns_in": input_shape[1] if input_shape else None,
+                "rows_out": output_shape[0] if output_shape else None,
+                "columns_out": output_shape[1] if output_shape else None,
+                "thread_id": threading.get_ident(),
+                "error": error,
+            }
+        )
+
+
+def _wrap(name, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _sink is None:
+            return func(*args, **kwargs)
+        return _record(name, func, args, kwargs)
+
+    return wrapper
+
+
+def instrument_class(cls):
+    """
+    Class decorator that wraps __init__ and every public method of cls for instrumentation.
+    Coroutine methods are left alone, since timing them would only measure creating the coroutine.
+    """
+    for attribute, value in list(vars(cls).items()):
+        if inspect.iscoroutinefunction(value):
+            continue
+        if inspect.isfunction(value) and (attribute == "__init__" or not attribute.startswith("_")):
+            setattr(cls, attribute, _wrap(f"{cls.__name__}.{attribute}", value))
+    return cls
+
+
+def enable(sink, track_memory=True):
+    """
+    Starts sending a record for every instrumented call to sink.
+
+    Parameters:
+    ----------
+    sink : object
+        An object with emit(record) and close() methods, e.g. InMemoryAggregator, JsonLinesSink or ChromeTraceSink.
+    track_memory : bool, optional
+        Whether to measure peak memory with tracemalloc, which slows traced code down. Default is True.
+        Memory deltas of calls running concurrently in several threads include each other's allocations.
+
+    cpu_seconds is the CPU time of the calling thread. It leaves out worker processes, e.g. those of
+    resampling and validation with n_jobs > 1, and is only close to wall_seconds for single-threaded work.
+    """
+    global _sink, _track_memory, _started_tracing
+    if track_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracing = True
+    _track_memory = track_memory
+    _sink = sink
+
+
+def disable():
+    """
+    Stops instrumentation and closes the current sink. tracemalloc is only stopped if enable() started it.
+
+    Returns:
+    -------
+    object
+        The sink that was in use, or None.
+    """
+    global _sink, _track_memory, _started_tracing
+    sink, _sink = _sink, None
+    if _started_tracing and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _started_tracing = False
+    _track_memory = False
+    if sink is not None:
+        sink.close()
+    return sink
+
+
+class instrumented:
+    """
+    Context manager that enables instrumentation with the given sink and disables it on exit.
+    """
+
+    def __init__(self, sink, track_memory=True):
+        self.sink = sink
+        self.track_memory = track_memory
+
+    def __enter__(self):
+        enable(self.sink, track_memory=self.track_memory)
+        return self.sink
+
+    def __exit__(self, *exc_info):
+        disable()
+        return False
+
+
+class InMemoryAggregator:
+    """
+    Sink that keeps every record in memory.
+
+    Attributes:
+    ----------
+    records : list of dict
+        The records received so far.
+    """
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        with self._lock:
+            self.records.append(record)
+
+    def close(self):
+        pass
+
+    def summary(self):
+        """
+        Aggregates the records per method.
+
+        Returns:
+        -------
+        DataFrame
+            One row per method with the call count, total and mean wall time, total CPU time, the largest
+            peak memory delta and the largest input and output row counts, sorted by total wall time.
+        """
+        import pandas as pd
+
+        columns = ["name", "wall_seconds", "cpu_seconds", "peak_memory_delta_bytes", "rows_in", "rows_out"]
+        records = pd.DataFrame(self.records, columns=columns)
+        return (
+            records.groupby("name")
+            .agg(
+                calls=("wall_seconds", "size"),
+                total_wall_seconds=("wall_seconds", "sum"),
+                mean_wall_seconds=("wall_seconds", "mean"),
+                total_cpu_seconds=("cpu_seconds", "sum"),
+                max_peak_memory_delta_bytes=("peak_memory_delta_bytes", "max"),
+                max_rows_in=("rows_in", "max"),
+                max_rows_out=("rows_out", "max"),
+            )
+            .sort_values("total_wall_seconds", ascending=False)
+        )
+
+
+class JsonLinesSink:
+    """
+    Sink that appends each record as one JSON object per line to a file.
+
+    Attributes:
+    ----------
+    file_path : str
+        The path of the JSON lines file.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._handle = open(file_path, "a")
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        line = json.dumps(record)
+        with self._lock:
+            self._handle.write(line + "\n")
+
+    def close(self):
+        with self._lock:
+            self._handle.close()
+
+
+class ChromeTraceSink:
+    """
+    Sink that writes the records as a Chrome trace (chrome://tracing or Perfetto) when closed.
+
+    Attributes:
+    ----------
+    file_path : str
+        The path of the trace JSON file.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.events = []
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        event = {
+            "name": record["name"],
+            "cat": record["name"].split(".")[0],
+            "ph": "X",
+            "ts": record["start_ns"] / 1000,
+            "dur": record["wall_seconds"] * 1e6,
+            "pid": os.getpid(),
+            "tid": record["thread_id"],
+            "args": {key: value for key, value in record.items() if key not in ("name", "start_ns", "thread_id")},
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def close(self):
+        with self._lock:
+            with open(self.file_path, "w") as handle:
+                json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, handle)
@@ -1,6 +1,9 @@
 import pandas as pd
 
+from building_analysis.instrumentation import instrument_class
 
+
+@instrument_class
 class BuildingDatasetLoader:
     """
     A class responsible for loading a building dataset from a specified file path.
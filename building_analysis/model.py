@@ -1,8 +1,7 @@
-from sklearn.pipeline import Pipeline
-from sklearn.compose import ColumnTransformer
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
-from sklearn.linear_model import LinearRegression
+from building_analysis.dataset import read_only_view
+from building_analysis.instrumentation import instrument_class
 
+@instrument_class
 class BuildingRegressionModel:
     """
     BuildingRegressionModel - A library for building regression models on building-related datasets.
@@ -54,9 +53,9 @@ class BuildingRegressionModel:
         Initializes the BuildingRegressionModel with the provided dataset.
 
         Args:
-            dataset (pd.DataFrame): The input dataset for building the regression model.
+            dataset (pd.DataFrame or DatasetHandle): The input dataset for building the regression model.
         """
-        self.dataset = dataset
+        self.dataset = read_only_view(dataset)
         self.pipeline = None
 
     def create_pipeline(self, numerical_cols, categorical_cols):
@@ -78,6 +77,11 @@ class BuildingRegressionModel:
         Raises:
             ValueError: If specified columns are missing in the dataset.
         """
+        from sklearn.pipeline import Pipeline
+        from sklearn.compose import ColumnTransformer
+        from sklearn.preprocessing import OneHotEncoder, StandardScaler
+        from sklearn.linear_model import LinearRegression
+
         # Check for missing columns
         missing_cols = [col for col in numerical_cols + categorical_cols if col not in self.dataset.columns]
         if missing_cols:
@@ -0,0 +1,442 @@
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import pickle
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from importlib import metadata
+
+from building_analysis.instrumentation import instrument_class
+
+
+def file_digest(file_path, chunk_size=1 << 20):
+    """
+    Returns the SHA-256 hex digest of a file's contents.
+
+    Parameters:
+    ----------
+    file_path : str
+        The path to the file.
+    chunk_size : int, optional
+        The number of bytes read at a time. Default is 1 MiB.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _code_fingerprint(func):
+    """
+    Returns a string identifying the code of func, so that editing a stage invalidates its cache.
+    """
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        return f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+
+
+# Distributions whose behaviour the stages depend on; upgrading any of them invalidates every cached output.
+LIBRARY_DISTRIBUTIONS = ("numpy", "pandas", "scikit-learn", "scipy")
+
+
+def _library_versions():
+    """
+    Returns the installed version of each of LIBRARY_DISTRIBUTIONS, or None where it is not installed.
+    """
+    versions = {}
+    for distribution in LIBRARY_DISTRIBUTIONS:
+        try:
+            versions[distribution] = metadata.version(distribution)
+        except metadata.PackageNotFoundError:
+            versions[distribution] = None
+    return versions
+
+
+def _module_digests(modules):
+    """
+    Returns the SHA-256 digest of the source file of each named module, found without importing it.
+
+    A stage wrapper only calls into the package classes, so its own source is not enough: an edit to e.g.
+    BuildingDatasetCleaner.remove_outliers must invalidate the outputs of the stages using that module.
+    """
+    digests = {}
+    for module in modules:
+        spec = importlib.util.find_spec(module)
+        if spec is None or spec.origin is None or not os.path.isfile(spec.origin):
+            raise ValueError(f"Cannot find the source of module '{module}'.")
+        digests[module] = file_digest(spec.origin)
+    return digests
+
+
+class Stage:
+    """
+    A single step of a Pipeline.
+
+    Attributes:
+    ----------
+    name : str
+        The unique name of the stage.
+    func : callable
+        Called as func(*upstream_outputs, **params).
+    inputs : list of str
+        The names of the stages whose outputs are passed to func, in order.
+    params : dict
+        Keyword arguments passed to func. Must be JSON-serializable (or have a stable repr).
+    files : list of str
+        Paths read by func; their contents are part of the cache key.
+    modules : list of str
+        Names of the modules whose code func runs, e.g. 'building_analysis.clean'; their sources are part
+        of the cache key.
+    """
+
+    def __init__(self, name, func, inputs=(), params=None, files=(), modules=()):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.params = dict(params or {})
+        self.files = list(files)
+        self.modules = list(modules)
+
+
+@instrument_class
+class Pipeline:
+    """
+    Runs a DAG of stages, caching each stage's output on disk.
+
+    A stage's cache key is a hash of its code, the sources of the modules it uses, the library versions, its
+    parameters, the contents of the files it reads and the keys of its upstream stages. A stage is therefore
+    only rerun when something it depends on, directly or upstream, has changed. Stages whose inputs are
+    ready run in parallel on a thread pool.
+
+    Attributes:
+    ----------
+    cache_dir : str
+        The directory holding cached stage outputs.
+    max_workers : int or None
+        The maximum number of stages run concurrently.
+    stages : dict
+        The registered stages by name, in insertion (topological) order.
+    executed : list of str
+        The stages computed during the last call to run.
+    cached : list of str
+        The stages loaded from the cache during the last call to run.
+    """
+
+    def __init__(self, cache_dir=".building_analysis_cache", max_workers=None):
+        """
+        Initializes an empty Pipeline.
+
+        Parameters:
+        ----------
+        cache_dir : str, optional
+            The directory holding cached stage outputs. Default is '.building_analysis_cache'.
+        max_workers : int or None, optional
+            The maximum number of stages run concurrently. Default lets the thread pool decide.
+        """
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.stages = {}
+        self.executed = []
+        self.cached = []
+
+    def add_stage(self, name, func, inputs=(), params=None, files=(), modules=()):
+        """
+        Registers a stage. Its inputs must already be registered, which keeps the graph acyclic.
+
+        Returns:
+        -------
+        Stage
+            The registered stage.
+
+        Raises:
+        ------
+        ValueError
+            If the name is already used or an input stage is unknown.
+        """
+        if name in self.stages:
+            raise ValueError(f"Stage '{name}' is already defined.")
+        unknown = [stage for stage in inputs if stage not in self.stages]
+        if unknown:
+            raise ValueError(f"Unknown input stages for '{name}': {unknown}")
+        self.stages[name] = Stage(name, func, inputs, params, files, modules)
+        return self.stages[name]
+
+    def stage_keys(self):
+        """
+        Computes the cache key of every stage.
+
+        Returns:
+        -------
+        dict
+            The hex cache key of each stage by name.
+        """
+        keys = {}
+        libraries = _library_versions()
+        for name, stage in self.stages.items():
+            payload = {
+                "name": name,
+                "code": _code_fingerprint(stage.func),
+                "modules": _module_digests(stage.modules),
+                "libraries": libraries,
+                "params": stage.params,
+                "files": [file_digest(path) for path in stage.files],
+                "inputs": [keys[upstream] for upstream in stage.inputs],
+            }
+            encoded = json.dumps(payload, sort_keys=True, default=repr).encode()
+            keys[name] = hashlib.sha256(encoded).hexdigest()
+        return keys
+
+    def _cache_path(self, name, key):
+        return os.path.join(self.cache_dir, f"{name}-{key}.pkl")
+
+    def _load(self, name, key):
+        with open(self._cache_path(name, key), "rb") as handle:
+            return pickle.load(handle)
+
+    def _store(self, name, key, output):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write to a temporary file first so an interrupted run never leaves a truncated cache entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump(output, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._cache_path(name, key))
+
+    def _leaves(self):
+        used = {upstream for stage in self.stages.values() for upstream in stage.inputs}
+        return [name for name in self.stages if name not in used]
+
+    def run(self, targets=None):
+        """
+        Runs the stages needed to produce the targets, reusing cached outputs where possible.
+
+        Parameters:
+        ----------
+        targets : list of str, optional
+            The stages whose outputs are wanted. Default is every stage without downstream stages.
+
+        Returns:
+        -------
+        dict
+            The output of each target stage by name.
+
+        Raises:
+        ------
+        ValueError
+            If a target stage is unknown.
+        """
+        targets = self._leaves() if targets is None else list(targets)
+        unknown = [name for name in targets if name not in self.stages]
+        if unknown:
+            raise ValueError(f"Unknown target stages: {unknown}")
+
+        keys = self.stage_keys()
+        hits = {name for name in self.stages if os.path.exists(self._cache_path(name, keys[name]))}
+
+        # Walk upstream from the targets, stopping at cache hits: only misses need computing.
+        to_run, to_load, pending = set(), set(), list(targets)
+        while pending:
+            name = pending.pop()
+            if name in to_run or name in to_load:
+                continue
+            if name in hits:
+                to_load.add(name)
+            else:
+                to_run.add(name)
+                pending.extend(self.stages[name].inputs)
+
+        outputs = {name: self._load(name, keys[name]) for name in self.stages if name in to_load}
+        self.cached = list(outputs)
+        self.executed = []
+
+        def execute(stage):
+            output = stage.func(*[outputs[upstream] for upstream in stage.inputs], **stage.params)
+            self._store(stage.name, keys[stage.name], output)
+            return output
+
+        remaining = [name for name in self.stages if name in to_run]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+            while remaining or running:
+                for name in [n for n in remaining if all(u in outputs for u in self.stages[n].inputs)]:
+                    remaining.remove(name)
+                    running[executor.submit(execute, self.stages[name])] = name
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    outputs[name] = future.result()
+                    self.executed.append(name)
+
+        return {name: outputs[name] for name in targets}
+
+
+def _load_stage(file_path):
+    from building_analysis.loader import BuildingDatasetLoader
+
+    dataset = BuildingDatasetLoader(file_path).load_building_dataset()
+    if isinstance(dataset, str):
+        raise FileNotFoundError(dataset)
+    return dataset
+
+
+def _summary_stage(dataset):
+    from building_analysis.summary import BuildingDatasetSummary
+
+    summary = BuildingDatasetSummary(dataset)
+    return {
+        "shape": summary.dataset_shape(),
+        "description": summary.dataset_description(),
+        "missing_values": summary.missing_values(),
+        "unique_value_counts": summary.unique_value_counts(),
+        "data_types": summary.data_types(),
+    }
+
+
+def _validate_stage(dataset):
+    from building_analysis.validation import BuildingDatasetValidator
+
+    validator = BuildingDatasetValidator(dataset)
+    return {
+        "valid": validator.validate(),
+        "quarantined": validator.quarantined_dataset,
+        "errors": validator.errors,
+    }
+
+
+def _clean_stage(validated, fill_column, fill_method, outlier_column, outlier_method, text_columns, date_column):
+    from building_analysis.clean import BuildingDatasetCleaner
+
+    # The cleaner works copy-on-write, so the loaded frame shared with other branches is left untouched.
+    cleaner = BuildingDatasetCleaner(validated["valid"])
+    cleaner.fill_missing_values(fill_column, method=fill_method)
+    cleaner.drop_missing_values()
+    cleaner.remove_outliers(outlier_column, method=outlier_method)
+    for column in text_columns:
+        cleaner.clean_text_columns(column)
+    cleaner.convert_to_datetime(date_column)
+    return cleaner.building_dataset
+
+
+def _inference_stage(dataset):
+    from building_analysis.inference import Inference
+
+    inference = Inference(dataset)
+    return {
+        "region_parking": inference.aggregate_data(),
+        "statistical_summary": inference.statistical_summary(),
+    }
+
+
+def _preprocess_stage(dataset):
+    from building_analysis.preprocessor import BuildingDatasetPreprocessor
+
+    return BuildingDatasetPreprocessor(dataset).preprocess_data()
+
+
+def _train_stage(dataset, numerical_cols, categorical_cols, target, test_size, random_state):
+    from sklearn.model_selection import train_test_split
+
+    from building_analysis.model import BuildingRegressionModel
+
+    X = dataset[numerical_cols + categorical_cols]
+    y = dataset[target]
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state)
+    pipeline = BuildingRegressionModel(dataset).create_pipeline(numerical_cols, categorical_cols)
+    pipeline.fit(X_train, y_train)
+    return {"pipeline": pipeline, "X_test": X_test, "y_test": y_test}
+
+
+def _evaluate_stage(trained):
+    from building_analysis.evaluator import ModelEvaluator
+
+    mse, r2 = ModelEvaluator().evaluate(trained["pipeline"], trained["X_test"], trained["y_test"])
+    return {"mse": mse, "r2": r2}
+
+
+def _modules(*names):
+    return [f"building_analysis.{name}" for name in names]
+
+
+def build_building_pipeline(
+    file_path,
+    numerical_cols=("Building Age",),
+    categorical_cols=("Location Code", "Region Code", "Bldg City", "Bldg County", "Bldg State", "Owned/Leased"),
+    target="Total Parking Spaces",
+    test_size=0.2,
+    random_state=42,
+    cache_dir=".building_analysis_cache",
+    max_workers=None,
+):
+    """
+    Builds the standard load -> validate -> clean -> preprocess -> train -> evaluate pipeline, with the
+    summary and inference branches alongside it.
+
+    Stages: 'load', 'summary', 'validate', 'clean', 'inference', 'preprocess', 'train', 'evaluate'. Rows
+    failing validation are quarantined in the 'validate' output and never reach 'clean'. The summary branch
+    only depends on 'load' and the inference branch only on 'clean', so both run in parallel with model
+    training, and changing e.g. the model columns only reruns 'train' and 'evaluate'. Each stage's cache key
+    covers the building_analysis modules it uses, so editing e.g. model.py also only reruns 'train' and
+    'evaluate', and editing cli.py or service.py reruns nothing.
+
+    Parameters:
+    ----------
+    file_path : str
+        The path to the building dataset CSV file.
+    numerical_cols, categorical_cols : sequence of str, optional
+        The model feature columns.
+    target : str, optional
+        The column the model predicts. Default is 'Total Parking Spaces'.
+    test_size : float, optional
+        The fraction of rows held out for evaluation. Default is 0.2.
+    random_state : int, optional
+        Seed for the train/test split. Default is 42.
+    cache_dir : str, optional
+        The directory holding cached stage outputs.
+    max_workers : int or None, optional
+        The maximum number of stages run concurrently.
+
+    Returns:
+    -------
+    Pipeline
+        The configured pipeline; call run() to execute it.
+    """
+    pipeline = Pipeline(cache_dir=cache_dir, max_workers=max_workers)
+    pipeline.add_stage(
+        "load", _load_stage, params={"file_path": file_path}, files=[file_path], modules=_modules("loader")
+    )
+    pipeline.add_stage("summary", _summary_stage, inputs=["load"], modules=_modules("summary", "dataset"))
+    pipeline.add_stage("validate", _validate_stage, inputs=["load"], modules=_modules("validation", "dataset"))
+    pipeline.add_stage(
+        "clean",
+        _clean_stage,
+        inputs=["validate"],
+        modules=_modules("clean", "dataset"),
+        params={
+            "fill_column": target,
+            "fill_method": "median",
+            "outlier_column": target,
+            "outlier_method": "IQR",
+            "text_columns": ["Bldg City"],
+            "date_column": "Construction Date",
+        },
+    )
+    pipeline.add_stage("inference", _inference_stage, inputs=["clean"], modules=_modules("inference", "dataset"))
+    pipeline.add_stage("preprocess", _preprocess_stage, inputs=["clean"], modules=_modules("preprocessor", "dataset"))
+    pipeline.add_stage(
+        "train",
+        _train_stage,
+        inputs=["preprocess"],
+        modules=_modules("model", "dataset"),
+        params={
+            "numerical_cols": list(numerical_cols),
+            "categorical_cols": list(categorical_cols),
+            "target": target,
+            "test_size": test_size,
+            "random_state": random_state,
+        },
+    )
+    pipeline.add_stage("evaluate", _evaluate_stage, inputs=["train"], modules=_modules("evaluator"))
+    return pipeline
@@ -1,5 +1,9 @@
 import pandas as pd
 
+from building_analysis.dataset import as_handle
+from building_analysis.instrumentation import instrument_class
+
+@instrument_class
 class BuildingDatasetPreprocessor:
     """
     BuildingDatasetPreprocessor - A library for preprocessing building-related datasets.
@@ -45,10 +49,20 @@ class BuildingDatasetPreprocessor:
         """
         Initializes the BuildingDatasetPreprocessor with the provided dataset.
 
+        The dataset is not copied up front: preprocessing writes through a copy-on-write DatasetHandle,
+        so only the columns it changes are materialized and the caller's frame is left untouched.
+
         Args:
-            dataset (pd.DataFrame): The input dataset to be processed.
+            dataset (pd.DataFrame or DatasetHandle): The input dataset to be processed.
+        """
+        self.handle = as_handle(dataset).fork()
+
+    @property
+    def dataset(self):
+        """
+        The dataset in its current state.
         """
-        self.dataset = dataset.copy()
+        return self.handle.frame
 
     def preprocess_data(self):
         """
@@ -67,12 +81,12 @@ class BuildingDatasetPreprocessor:
             raise ValueError(f"Missing columns in the dataset: {missing_columns}")
 
         # Convert 'Construction Date' to datetime format
-        self.dataset['Construction Date'] = pd.to_datetime(self.dataset['Construction Date'], errors='coerce')
+        self.handle.set_column('Construction Date', pd.to_datetime(self.dataset['Construction Date'], errors='coerce'))
 
         # Calculate 'Building Age' based on the construction date
-        self.dataset['Building Age'] = 2023 - self.dataset['Construction Date'].dt.year
+        self.handle.set_column('Building Age', 2023 - self.dataset['Construction Date'].dt.year)
 
         # Drop rows with missing values
-        self.dataset.dropna(inplace=True)
+        self.handle.filter_rows(self.dataset.notna().all(axis=1))
 
         return self.dataset
@@ -0,0 +1,178 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Upper bound on the number of elements in a single resampling index matrix.
+# Keeps each batch around 32 MB of int64 indices regardless of group size.
+MAX_BATCH_ELEMENTS = 2 ** 22
+
+
+def _batch_sizes(n_resamples, n_rows, batch_size=None):
+    """
+    Splits n_resamples into batch sizes so that a (batch, n_rows) index matrix stays within MAX_BATCH_ELEMENTS.
+    """
+    if batch_size is None:
+        batch_size = max(1, MAX_BATCH_ELEMENTS // max(n_rows, 1))
+    batch_size = min(batch_size, n_resamples)
+    full, remainder = divmod(n_resamples, batch_size)
+    return [batch_size] * full + ([remainder] if remainder else [])
+
+
+def _segment_statistic(values, n_a, statistic):
+    """
+    Computes the statistic of the first n_a columns and the remaining columns of each row of values.
+
+    Means are computed with a single segment reduction (np.add.reduceat) over the flattened matrix,
+    medians with a row-wise partition.
+
+    Returns:
+    -------
+    ndarray
+        Difference between the two segments for each row.
+    """
+    n_rows, width = values.shape
+    n_b = width - n_a
+    if statistic == "mean":
+        starts = (np.arange(n_rows)[:, None] * width + np.array([0, n_a])).ravel()
+        sums = np.add.reduceat(values.ravel(), starts).reshape(n_rows, 2)
+        return sums[:, 0] / n_a - sums[:, 1] / n_b
+    return np.median(values[:, :n_a], axis=1) - np.median(values[:, n_a:], axis=1)
+
+
+def _permutation_chunk(pooled, n_a, statistic, batch, seed):
+    """
+    Draws one batch of permutations of the pooled values and returns the resampled differences.
+    """
+    rng = np.random.default_rng(seed)
+    # Partitioning uniform keys around position n_a yields a uniformly random split into the two
+    # groups in linear time; the order within each group does not affect either statistic.
+    index = np.argpartition(rng.random((batch, pooled.size)), n_a - 1, axis=1)
+    return _segment_statistic(pooled[index], n_a, statistic)
+
+
+def _bootstrap_chunk(a, b, statistic, batch, seed):
+    """
+    Draws one batch of bootstrap samples (with replacement, within each group) and returns the differences.
+    """
+    rng = np.random.default_rng(seed)
+    index_a = rng.integers(0, a.size, size=(batch, a.size))
+    index_b = rng.integers(0, b.size, size=(batch, b.size))
+    values = np.concatenate([a[index_a], b[index_b]], axis=1)
+    return _segment_statistic(values, a.size, statistic)
+
+
+def _run_chunks(worker, args, batches, random_state, n_jobs):
+    """
+    Runs worker over every batch with an independent child seed and concatenates the results.
+
+    Each batch draws from its own SeedSequence child, so the output depends only on random_state and
+    the batch layout, not on n_jobs.
+    """
+    seeds = np.random.SeedSequence(random_state).spawn(len(batches))
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs is None or n_jobs <= 1 or len(batches) == 1:
+        results = [worker(*args, batch, seed) for batch, seed in zip(batches, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(batches))) as executor:
+            futures = [executor.submit(worker, *args, batch, seed) for batch, seed in zip(batches, seeds)]
+            results = [future.result() for future in futures]
+    return np.concatenate(results)
+
+
+def _validate(a, b, statistic, n_resamples):
+    if statistic not in ("mean", "median"):
+        raise ValueError("Invalid statistic. Please choose 'mean' or 'median'.")
+    if a.size == 0 or b.size == 0:
+        raise ValueError("Both groups must contain at least one value.")
+    if n_resamples < 1:
+        raise ValueError("n_resamples must be a positive integer.")
+
+
+def permutation_test(a, b, statistic="mean", n_resamples=10000, random_state=None, n_jobs=1, batch_size=None):
+    """
+    Two-sided permutation test for the difference in means or medians between two samples.
+
+    Parameters:
+    ----------
+    a, b : array-like
+        The values of the two groups.
+    statistic : str, optional
+        'mean' or 'median'. Default is 'mean'.
+    n_resamples : int, optional
+        The number of permutations to draw. Default is 10000.
+    random_state : int or None, optional
+        Seed for reproducible results. Results do not depend on n_jobs.
+    n_jobs : int, optional
+        Number of worker processes; -1 uses every CPU. Default is 1 (in-process).
+    batch_size : int or None, optional
+        Permutations per batch. By default chosen to bound the size of each index matrix.
+
+    Returns:
+    -------
+    dict
+        'observed' difference (a - b), two-sided 'p_value', and 'n_resamples'.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    _validate(a, b, statistic, n_resamples)
+
+    pooled = np.concatenate([a, b])
+    observed = _segment_statistic(pooled[None, :], a.size, statistic)[0]
+    batches = _batch_sizes(n_resamples, pooled.size, batch_size)
+    differences = _run_chunks(_permutation_chunk, (pooled, a.size, statistic), batches, random_state, n_jobs)
+
+    # Add-one correction so the p-value is never exactly zero.
+    extreme = np.count_nonzero(np.abs(differences) >= abs(observed) - 1e-12)
+    p_value = (extreme + 1) / (n_resamples + 1)
+    return {"observed": observed, "p_value": p_value, "n_resamples": n_resamples}
+
+
+def bootstrap_confidence_interval(
+    a, b, statistic="mean", n_resamples=10000, confidence_level=0.95, random_state=None, n_jobs=1, batch_size=None
+):
+    """
+    Percentile bootstrap confidence interval for the difference in means or medians between two samples.
+
+    Parameters:
+    ----------
+    a, b : array-like
+        The values of the two groups.
+    statistic : str, optional
+        'mean' or 'median'. Default is 'mean'.
+    n_resamples : int, optional
+        The number of bootstrap samples to draw. Default is 10000.
+    confidence_level : float, optional
+        The confidence level of the interval. Default is 0.95.
+    random_state : int or None, optional
+        Seed for reproducible results. Results do not depend on n_jobs.
+    n_jobs : int, optional
+        Number of worker processes; -1 uses every CPU. Default is 1 (in-process).
+    batch_size : int or None, optional
+        Bootstrap samples per batch. By default chosen to bound the size of each index matrix.
+
+    Returns:
+    -------
+    dict
+        'observed' difference (a - b), 'lower' and 'upper' bounds, 'confidence_level' and 'n_resamples'.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    _validate(a, b, statistic, n_resamples)
+    if not 0 < confidence_level < 1:
+        raise ValueError("confidence_level must be between 0 and 1.")
+
+    observed = _segment_statistic(np.concatenate([a, b])[None, :], a.size, statistic)[0]
+    batches = _batch_sizes(n_resamples, a.size + b.size, batch_size)
+    differences = _run_chunks(_bootstrap_chunk, (a, b, statistic), batches, random_state, n_jobs)
+
+    alpha = (1 - confidence_level) / 2
+    lower, upper = np.quantile(differences, [alpha, 1 - alpha])
+    return {
+        "observed": observed,
+        "lower": lower,
+        "upper": upper,
+        "confidence_level": confidence_level,
+        "n_resamples": n_resamples,
+    }
@@ -0,0 +1,346 @@
+"""
+Asyncio ingestion service that keeps building aggregates up to date as records change.
+
+Clients send newline-delimited JSON requests over TCP and get one JSON line back per request:
+
+    {"op": "upsert", "records": [{"Location Code": "CT0013", "Region Code": 1, ...}, ...]}
+    {"op": "upsert", "records": [{"Location Code": "CT0013", "Total Parking Spaces": 5}]}
+    {"op": "delete", "codes": ["CT0013"]}
+    {"op": "get", "code": "CT0013"}
+    {"op": "region_parking"}
+    {"op": "summary"}
+    {"op": "frequencies", "column": "Bldg State"}
+
+Each upsert batch is applied in one step on the event loop, so concurrent reads never see half a batch,
+and is checked in full first, so an invalid record rejects the whole batch without changing any state.
+Deletes are checked in full the same way.
+"""
+import asyncio
+import json
+import math
+import numbers
+from collections import Counter
+
+from building_analysis.instrumentation import instrument_class
+
+# Columns whose value counts are maintained, as BuildingDatasetSummary.column_value_frequencies reports them.
+FREQUENCY_COLUMNS = [
+    "Region Code",
+    "Bldg State",
+    "Bldg Status",
+    "Property Type",
+    "Owned/Leased",
+    "Historical Status",
+    "ABA Accessibility Flag ",
+]
+
+
+def _is_missing(value):
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+@instrument_class
+class LiveBuildingTable:
+    """
+    An in-memory building table keyed by 'Location Code' with incrementally maintained aggregates.
+
+    The aggregates match their batch counterparts: region_parking() matches Inference.aggregate_data(),
+    and shape(), missing_values() and column_value_frequencies() match the BuildingDatasetSummary methods
+    of the same names.
+
+    Attributes:
+    ----------
+    key_column : str
+        The column identifying a building.
+    records : dict
+        The current record of each building by key.
+    """
+
+    def __init__(self, key_column="Location Code", frequency_columns=None):
+        """
+        Initializes an empty table.
+
+        Parameters:
+        ----------
+        key_column : str, optional
+            The column identifying a building. Default is 'Location Code'.
+        frequency_columns : list of str, optional
+            The columns whose value counts are maintained. Default is FREQUENCY_COLUMNS.
+        """
+        self.key_column = key_column
+        self.frequency_columns = FREQUENCY_COLUMNS if frequency_columns is None else frequency_columns
+        self.records = {}
+        self.columns = []
+        self._column_set = set()
+        self._region_sum = Counter()
+        self._region_count = Counter()
+        self._missing = Counter()
+        self._frequencies = {column: Counter() for column in self.frequency_columns}
+
+    @classmethod
+    def from_frame(cls, dataset, **kwargs):
+        """
+        Builds a table from a DataFrame, e.g. the output of BuildingDatasetLoader.load_building_dataset().
+        """
+        table = cls(**kwargs)
+        table.upsert(dataset.to_dict("records"))
+        return table
+
+    def _apply(self, record, sign):
+        region, parking = record.get("Region Code"), record.get("Total Parking Spaces")
+        if not _is_missing(region) and not _is_missing(parking):
+            self._region_sum[region] += sign * parking
+            self._region_count[region] += sign
+            if self._region_count[region] == 0:
+                del self._region_sum[region], self._region_count[region]
+        for column, value in record.items():
+            if _is_missing(value):
+                self._missing[column] += sign
+        for column, counts in self._frequencies.items():
+            value = record.get(column)
+            if not _is_missing(value):
+                counts[value] += sign
+                if counts[value] == 0:
+                    del counts[value]
+
+    def _check_record(self, record):
+        """
+        Raises if record cannot be applied, so that a batch is checked in full before any state changes.
+        """
+        if not isinstance(record, dict):
+            raise TypeError(f"Every record must be an object, got {type(record).__name__}.")
+        if _is_missing(record.get(self.key_column)):
+            raise ValueError(f"Every record needs a '{self.key_column}'.")
+        # Regions are sorted by region_parking(), so a single text region would break every later query.
+        for column in ("Region Code", "Total Parking Spaces"):
+            value = record.get(column)
+            if not _is_missing(value) and (isinstance(value, bool) or not isinstance(value, numbers.Real)):
+                raise TypeError(f"'{column}' must be a number, got {value!r}.")
+        for column in dict.fromkeys([self.key_column, "Region Code", *self._frequencies]):
+            try:
+                hash(record.get(column))
+            except TypeError:
+                raise TypeError(f"'{column}' must be a single value, got {record.get(column)!r}.") from None
+
+    def upsert(self, records):
+        """
+        Inserts new buildings and updates existing ones, updating every aggregate incrementally.
+
+        The fields of a record for an existing building are merged into its current record, so a partial
+        record such as {'Location Code': 'CT0013', 'Total Parking Spaces': 5} only changes the parking count.
+
+        Parameters:
+        ----------
+        records : list of dict
+            The building records, complete or partial. Each must contain the key column.
+
+        Returns:
+        -------
+        int
+            The number of records applied.
+
+        Raises:
+        ------
+        ValueError
+            If a record has no key.
+        TypeError
+            If a record is not a dict, its region or parking count is not a number, or its key or a
+            maintained frequency value is not hashable.
+            The whole batch is checked first, so no record of it is applied when either error is raised.
+        """
+        for record in records:
+            self._check_record(record)
+        for record in records:
+            key = record[self.key_column]
+            previous = self.records.get(key)
+            if previous is not None:
+                self._apply(previous, -1)
+                record = {**previous, **record}
+            self._apply(record, 1)
+            self.records[key] = record
+            if len(record) != len(self.columns) or not self._column_set.issuperset(record):
+                for column in record:
+                    if column not in self._column_set:
+                        self._column_set.add(column)
+                        self.columns.append(column)
+        return len(records)
+
+    def delete(self, keys):
+        """
+        Removes buildings by key. Unknown keys are ignored.
+
+        Returns:
+        -------
+        int
+            The number of buildings removed.
+
+        Raises:
+        ------
+        TypeError
+            If a key is not hashable. Every key is checked first, so no building is removed in that case.
+        """
+        for key in keys:
+            try:
+                hash(key)
+            except TypeError:
+                raise TypeError(f"Every key must be a single value, got {key!r}.") from None
+        removed = 0
+        for key in keys:
+            previous = self.records.pop(key, None)
+            if previous is not None:
+                self._apply(previous, -1)
+                removed += 1
+        return removed
+
+    def get(self, key):
+        """Returns the current record of a building, or None."""
+        return self.records.get(key)
+
+    def region_parking(self):
+        """
+        Returns the mean 'Total Parking Spaces' per 'Region Code', sorted by region, as Inference.aggregate_data().
+        """
+        return {region: self._region_sum[region] / self._region_count[region] for region in sorted(self._region_count)}
+
+    def shape(self):
+        """Returns (rows, columns) of the table."""
+        return (len(self.records), len(self.columns))
+
+    def missing_values(self):
+        """Returns the count of missing values in each column."""
+        return {column: self._missing[column] for column in self.columns}
+
+    def column_value_frequencies(self, column_name):
+        """
+        Returns the frequency of each value in a maintained column, most frequent first.
+
+        Raises:
+        ------
+        ValueError
+            If the column's frequencies are not maintained.
+        """
+        if column_name not in self._frequencies:
+            raise ValueError(f"Frequencies of column '{column_name}' are not maintained.")
+        return dict(self._frequencies[column_name].most_common())
+
+
+@instrument_class
+class BuildingIngestionService:
+    """
+    Serves a LiveBuildingTable over a local TCP socket with asyncio.
+
+    Attributes:
+    ----------
+    table : LiveBuildingTable
+        The table being maintained.
+    host, port : str, int
+        The address the service listens on. Port 0 picks a free port, available as port after start().
+    """
+
+    def __init__(self, table=None, host="127.0.0.1", port=8765):
+        self.table = LiveBuildingTable() if table is None else table
+        self.host = host
+        self.port = port
+        self._server = None
+
+    def handle(self, request):
+        """
+        Answers one decoded request and returns the response object. Runs without awaiting, so each
+        request, including a whole upsert batch, is applied atomically with respect to other clients.
+        """
+        if not isinstance(request, dict):
+            return {"ok": False, "error": f"Every request must be an object, got {type(request).__name__}."}
+        op = request.get("op")
+        try:
+            if op in ("upsert", "delete"):
+                field = "records" if op == "upsert" else "codes"
+                if not isinstance(request[field], list):
+                    raise TypeError(f"'{field}' must be a list, got {type(request[field]).__name__}.")
+            if op == "upsert":
+                result = self.table.upsert(request["records"])
+            elif op == "delete":
+                result = self.table.delete(request["codes"])
+            elif op == "get":
+                result = self.table.get(request["code"])
+            elif op == "region_parking":
+                result = [[region, mean] for region, mean in self.table.region_parking().items()]
+            elif op == "summary":
+                result = {"shape": self.table.shape(), "missing_values": self.table.missing_values()}
+            elif op == "frequencies":
+                result = list(self.table.column_value_frequencies(request["column"]).items())
+            else:
+                return {"ok": False, "error": f"Unknown op '{op}'."}
+        except (KeyError, ValueError, TypeError) as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        return {"ok": True, "result": result}
+
+    async def _serve_client(self, reader, writer):
+        try:
+            while line := await reader.readline():
+                try:
+                    response = self.handle(json.loads(line))
+                except json.JSONDecodeError as e:
+                    response = {"ok": False, "error": f"Invalid JSON: {e}"}
+                writer.write(json.dumps(response, default=str).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        """Starts listening; returns once the socket is bound."""
+        self._server = await asyncio.start_server(self._serve_client, self.host, self.port, limit=2 ** 26)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """Stops listening and waits for the server to close."""
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def serve_forever(self):
+        """Starts the service and serves until cancelled."""
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+
+@instrument_class
+class BuildingIngestionClient:
+    """
+    Minimal asyncio client for BuildingIngestionService. Requests on one client are sent one at a time.
+    """
+
+    def __init__(self, host="127.0.0.1", port=8765):
+        self.host = host
+        self.port = port
+        self._reader = self._writer = None
+
+    async def connect(self):
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port, limit=2 ** 26)
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+
+    async def request(self, op, **fields):
+        """
+        Sends one request and returns its result.
+
+        Raises:
+        ------
+        ValueError
+            If the service reports an error.
+        """
+        self._writer.write(json.dumps({"op": op, **fields}, default=str).encode() + b"\n")
+        await self._writer.drain()
+        response = json.loads(await self._reader.readline())
+        if not response["ok"]:
+            raise ValueError(response["error"])
+        return response["result"]
+
+    async def upsert(self, records):
+        return await self.request("upsert", records=records)
+
+    async def region_parking(self):
+        return dict(await self.request("region_parking"))
@@ -1,6 +1,9 @@
 import pandas as pd
-import matplotlib.pyplot as plt
 
+from building_analysis.dataset import read_only_view
+from building_analysis.instrumentation import instrument_class
+
+@instrument_class
 class BuildingDatasetSummary:
     """
     This class provides a summary of the building dataset. It includes methods to return the shape of the dataset,
@@ -29,10 +32,10 @@ class BuildingDatasetSummary:
 
         Parameters:
         ----------
-        dataset : DataFrame
-            The building dataset loaded from a CSV file.
+        dataset : DataFrame or DatasetHandle
+            The building dataset loaded from a CSV file. Only a zero-copy view of it is kept.
         """
-        self.building_dataset = dataset
+        self.building_dataset = read_only_view(dataset)
 
     def dataset_shape(self):
         """
@@ -139,6 +142,8 @@ class BuildingDatasetSummary:
         """
         Plots histograms for all numeric columns in the dataset.
         """
+        import matplotlib.pyplot as plt
+
         numeric_columns = self.building_dataset.select_dtypes(include='number').columns
         for column in numeric_columns:
             self.building_dataset[column].hist()
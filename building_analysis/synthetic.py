@@ -0,0 +1,146 @@
+import numpy as np
+import pandas as pd
+
+from building_analysis.instrumentation import instrument_class
+
+# Columns sampled together so that generated rows stay internally consistent
+# (a city always sits in its own state, county, zip and region).
+GEOGRAPHY_COLUMNS = [
+    "Region Code",
+    "Bldg Address1",
+    "Bldg Address2",
+    "Bldg City",
+    "Bldg County",
+    "Bldg State",
+    "Bldg Zip",
+    "Congressional District",
+]
+ATTRIBUTE_COLUMNS = [
+    "Bldg Status",
+    "Property Type",
+    "Owned/Leased",
+    "Historical Type",
+    "Historical Status",
+    "ABA Accessibility Flag ",
+]
+MEASURE_COLUMNS = ["Bldg ANSI Usable", "Total Parking Spaces", "Construction Date"]
+
+
+@instrument_class
+class SyntheticBuildingDataGenerator:
+    """
+    Generates synthetic building datasets with the schema and value distributions of a reference dataset
+    (e.g. DakshitAPProject1.csv), at any size and deterministically for a given seed.
+
+    Geography, building attributes and measures are each drawn jointly from the reference rows, so
+    regions, states, zips and cities stay consistent, and area and parking stay correlated. Areas and
+    parking counts are jittered so that large datasets are not just repeated reference values.
+
+    Attributes:
+    ----------
+    reference : DataFrame
+        The dataset whose schema and distributions are reproduced.
+    random_state : int
+        The seed that makes generated data reproducible.
+    jitter : float
+        The standard deviation of the log-normal noise applied to areas and parking counts.
+    """
+
+    def __init__(self, reference_dataset, random_state=0, jitter=0.1):
+        """
+        Initializes the generator from a reference dataset.
+
+        Parameters:
+        ----------
+        reference_dataset : DataFrame or str
+            The reference dataset, or the path to its CSV file.
+        random_state : int, optional
+            The seed that makes generated data reproducible. Default is 0.
+        jitter : float, optional
+            The standard deviation of the log-normal noise applied to areas and parking counts. Default is 0.1.
+
+        Raises:
+        ------
+        ValueError
+            If the reference dataset is missing required columns.
+        """
+        if isinstance(reference_dataset, str):
+            reference_dataset = pd.read_csv(reference_dataset)
+        required_columns = GEOGRAPHY_COLUMNS + ATTRIBUTE_COLUMNS + MEASURE_COLUMNS
+        missing_columns = [col for col in required_columns if col not in reference_dataset.columns]
+        if missing_columns:
+            raise ValueError(f"Missing columns in the dataset: {missing_columns}")
+
+        self.reference = reference_dataset
+        self.random_state = random_state
+        self.jitter = jitter
+        self.columns = list(reference_dataset.columns)
+        self._blocks = [
+            {col: reference_dataset[col].to_numpy() for col in block}
+            for block in (GEOGRAPHY_COLUMNS, ATTRIBUTE_COLUMNS, MEASURE_COLUMNS)
+        ]
+
+    def generate(self, n_rows, start=0, code_width=None):
+        """
+        Generates n_rows synthetic rows.
+
+        Rows are seeded by (random_state, start), so generating a large dataset in chunks with increasing
+        start offsets is reproducible.
+
+        Parameters:
+        ----------
+        n_rows : int
+            The number of rows to generate.
+        start : int, optional
+            The row offset of this chunk, used for seeding and for unique 'Location Code' values. Default is 0.
+        code_width : int, optional
+            The number of digits in 'Location Code'. Default fits start + n_rows (at least 4, as in the reference).
+
+        Returns:
+        -------
+        DataFrame
+            The synthetic dataset, with the reference columns in the reference order.
+        """
+        rng = np.random.default_rng([self.random_state, start])
+        n_reference = len(self.reference)
+        data = {}
+        for block in self._blocks:
+            index = rng.integers(0, n_reference, size=n_rows)
+            for col, values in block.items():
+                data[col] = values[index]
+
+        for col in ("Bldg ANSI Usable", "Total Parking Spaces"):
+            noise = rng.lognormal(mean=0.0, sigma=self.jitter, size=n_rows)
+            data[col] = np.rint(data[col] * noise).astype(np.int64)
+
+        if code_width is None:
+            code_width = max(4, len(str(start + n_rows)))
+        numbers = pd.Series(np.arange(start, start + n_rows)).astype(str).str.zfill(code_width)
+        data["Location Code"] = (pd.Series(data["Bldg State"]) + numbers).to_numpy()
+
+        return pd.DataFrame(data, columns=self.columns)
+
+    def write_csv(self, file_path, n_rows, chunk_size=1_000_000):
+        """
+        Writes n_rows synthetic rows to a CSV file in chunks, so memory use does not grow with n_rows.
+        The output is reproducible for a given random_state and chunk_size.
+
+        Parameters:
+        ----------
+        file_path : str
+            The path of the CSV file to write.
+        n_rows : int
+            The total number of rows to write.
+        chunk_size : int, optional
+            The number of rows generated and written at a time. Default is 1,000,000.
+
+        Returns:
+        -------
+        str
+            The path of the written file.
+        """
+        code_width = max(4, len(str(n_rows)))
+        for start in range(0, n_rows, chunk_size):
+            chunk = self.generate(min(chunk_size, n_rows - start), start=start, code_width=code_width)
+            chunk.to_csv(file_path, mode="w" if start == 0 else "a", header=start == 0, index=False)
+        return file_path
@@ -0,0 +1,304 @@
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+import pandas as pd
+
+from building_analysis.dataset import as_handle
+from building_analysis.instrumentation import instrument_class
+
+# The 50 states plus DC and the territories present in the GSA inventory.
+US_STATES = [
+    "AK", "AL", "AR", "AS", "AZ", "CA", "CO", "CT", "DC", "DE", "FL", "GA", "GU", "HI", "IA", "ID",
+    "IL", "IN", "KS", "KY", "LA", "MA", "MD", "ME", "MI", "MN", "MO", "MP", "MS", "MT", "NC", "ND",
+    "NE", "NH", "NJ", "NM", "NV", "NY", "OH", "OK", "OR", "PA", "PR", "RI", "SC", "SD", "TN", "TX",
+    "UT", "VA", "VI", "VT", "WA", "WI", "WV", "WY",
+]
+
+
+class Rule:
+    """
+    A declarative validation rule on one column.
+
+    Attributes:
+    ----------
+    name : str
+        The rule name reported in the error table.
+    column : str
+        The column the rule checks.
+    check : callable
+        Vectorized check: takes a Series and returns a boolean array, True where the value is valid.
+    severity : str
+        'error' rows are quarantined; 'warning' rows are only reported.
+    on_unique : bool
+        Whether to evaluate the check once per distinct value instead of once per row. This is much faster
+        for text columns with few distinct values (states, dates, zips).
+    allow_missing : bool
+        Whether missing values pass the rule, e.g. because the cleaning stage imputes them.
+    """
+
+    def __init__(self, name, column, check, severity="error", on_unique=True, allow_missing=False):
+        if severity not in ("error", "warning"):
+            raise ValueError("Invalid severity. Please choose 'error' or 'warning'.")
+        self.name = name
+        self.column = column
+        self.check = check
+        self.severity = severity
+        self.on_unique = on_unique
+        self.allow_missing = allow_missing
+
+    def valid_mask(self, values):
+        """
+        Returns a boolean array that is True where values pass the rule. Missing values fail unless
+        allow_missing is set.
+        """
+        if self.on_unique:
+            codes, uniques = pd.factorize(values)
+            valid_uniques = np.asarray(self.check(pd.Series(uniques)), dtype=bool)
+            # factorize marks missing values with code -1, which picks the appended allow_missing.
+            return np.append(valid_uniques, self.allow_missing)[codes]
+        missing = values.isna().to_numpy()
+        return np.where(missing, self.allow_missing, np.asarray(self.check(values), dtype=bool))
+
+
+# Check factories return functools.partial objects of module-level functions rather than lambdas, so that
+# rules can be pickled to the worker processes of BuildingDatasetValidator.validate(n_jobs > 1).
+
+
+def _matches(values, pattern):
+    return values.astype(str).str.fullmatch(pattern).fillna(False).to_numpy(dtype=bool)
+
+
+def matches(pattern):
+    """
+    Check factory: the value, as text, fully matches the regular expression pattern.
+    """
+    return functools.partial(_matches, pattern=pattern)
+
+
+def _zip_code(values, text_pattern):
+    if pd.api.types.is_numeric_dtype(values):
+        is_text = np.zeros(len(values), dtype=bool)
+    else:
+        is_text = values.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+    numbers = pd.to_numeric(values.mask(is_text), errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    with np.errstate(invalid="ignore"):
+        whole = np.isfinite(numbers) & (numbers == np.floor(numbers))
+        digits_ok = ((numbers >= 1e2) & (numbers < 1e5)) | ((numbers >= 1e6) & (numbers < 1e9))
+    valid = whole & digits_ok
+    if is_text.any():
+        valid[is_text] = _matches(values[is_text], text_pattern)
+    return valid
+
+
+def zip_code(text_pattern=r"\d{3,5}|\d{7,9}"):
+    """
+    Check factory: the value is a zip code. Numbers are checked as numbers: they must be whole and have
+    3-5 or 7-9 digits, so that a column pandas read as float because of one blank cell is not checked
+    on text like '61031125.0'. Text values must fully match text_pattern.
+    """
+    return functools.partial(_zip_code, text_pattern=text_pattern)
+
+
+def _one_of(values, allowed):
+    return values.isin(allowed).to_numpy()
+
+
+def one_of(allowed):
+    """
+    Check factory: the value is one of the allowed values.
+    """
+    return functools.partial(_one_of, allowed=list(allowed))
+
+
+def _parses_as_date(values, format_string):
+    return pd.to_datetime(values, format=format_string, errors="coerce").notna().to_numpy()
+
+
+def parses_as_date(format_string="%d-%b-%Y"):
+    """
+    Check factory: the value parses as a date in the given format.
+    """
+    return functools.partial(_parses_as_date, format_string=format_string)
+
+
+def _non_negative(values):
+    return (pd.to_numeric(values, errors="coerce") >= 0).to_numpy()
+
+
+def non_negative():
+    """
+    Check factory: the value is a number greater than or equal to zero.
+    """
+    return _non_negative
+
+
+def _not_blank(values):
+    return (values.astype(str).str.strip() != "").to_numpy()
+
+
+def not_blank():
+    """
+    Check factory: the value is not empty or whitespace only.
+    """
+    return _not_blank
+
+
+# The CSV stores zips as integers, which drops leading zeros: a valid 5-digit zip or 9-digit ZIP+4
+# therefore has 3-5 or 7-9 digits (e.g. Puerto Rico's 00601 is read as 601).
+BUILDING_RULES = [
+    Rule("zip_format", "Bldg Zip", zip_code()),
+    Rule("known_state", "Bldg State", one_of(US_STATES)),
+    Rule("date_format", "Construction Date", parses_as_date("%d-%b-%Y")),
+    # Missing counts are imputed by BuildingDatasetCleaner.fill_missing_values, so only negatives are errors.
+    Rule("non_negative", "Total Parking Spaces", non_negative(), on_unique=False, allow_missing=True),
+    # Blank for almost every row of the GSA extract, so only reported rather than quarantined.
+    Rule("not_blank", "Congressional District", not_blank(), severity="warning"),
+]
+
+
+def _check_chunk(rules, chunk):
+    """
+    Checks one chunk against rules and returns (row positions, rule indices) of its failed checks, and the
+    mask of rows failing an 'error' rule. Module-level so that it can run in a worker process.
+    """
+    positions, rule_ids = [], []
+    failed = np.zeros(len(chunk), dtype=bool)
+    for rule_id, rule in enumerate(rules):
+        invalid = ~rule.valid_mask(chunk[rule.column])
+        rows = np.flatnonzero(invalid)
+        positions.append(rows)
+        rule_ids.append(np.full(len(rows), rule_id, dtype=np.int16))
+        if rule.severity == "error":
+            failed |= invalid
+    return np.concatenate(positions), np.concatenate(rule_ids), failed
+
+
+@instrument_class
+class BuildingDatasetValidator:
+    """
+    Validates a building dataset against declarative rules, between loading and cleaning.
+
+    Every rule is checked with vectorized column operations; large datasets are split into row chunks that
+    can be checked in parallel worker processes. Rows failing an 'error' rule are quarantined.
+
+    Attributes:
+    ----------
+    rules : list of Rule
+        The rules to check. Defaults to BUILDING_RULES.
+    errors : DataFrame or None
+        After validate(): one row per failed check, with the 'row' index label, 'column', 'rule' and 'severity'.
+    valid_dataset : DataFrame or None
+        After validate(): the rows that passed every 'error' rule.
+    quarantined_dataset : DataFrame or None
+        After validate(): the rows that failed at least one 'error' rule.
+
+    Usage:
+        validator = BuildingDatasetValidator(loaded_dataset)
+        valid_dataset = validator.validate()
+        cleaner = BuildingDatasetCleaner(valid_dataset)
+    """
+
+    def __init__(self, dataset, rules=None):
+        """
+        Initializes the validator with the provided dataset.
+
+        Parameters:
+        ----------
+        dataset : DataFrame or DatasetHandle
+            The building dataset loaded from a CSV file.
+        rules : list of Rule, optional
+            The rules to check. Default is BUILDING_RULES.
+        """
+        # Forked and never filtered, so validate() leaves the caller's handle alone and can be called again.
+        self.handle = as_handle(dataset).fork()
+        self.rules = BUILDING_RULES if rules is None else rules
+        self.errors = None
+        self.valid_dataset = None
+        self.quarantined_dataset = None
+
+    def _labels(self, rule_ids, attribute):
+        """
+        Returns a categorical of the given rule attribute for each rule index, without building strings per row.
+        """
+        labels = [getattr(rule, attribute) for rule in self.rules]
+        categories = list(dict.fromkeys(labels))
+        codes = np.array([categories.index(label) for label in labels], dtype=np.int16)
+        return pd.Categorical.from_codes(codes[rule_ids], categories)
+
+    def validate(self, chunk_size=1_000_000, n_jobs=1):
+        """
+        Checks every rule and splits the dataset into valid and quarantined rows.
+
+        Parameters:
+        ----------
+        chunk_size : int, optional
+            The number of rows checked per chunk. Default is 1,000,000.
+        n_jobs : int, optional
+            The number of worker processes checking chunks. Most checks are pandas string operations that
+            hold the GIL, so chunks are checked in processes rather than threads; the columns the rules
+            read are pickled to the workers, and the rules' checks must be picklable. Default is 1, which
+            checks every chunk in this process.
+
+        Returns:
+        -------
+        DataFrame
+            The rows that passed every 'error' rule.
+
+        Raises:
+        ------
+        ValueError
+            If a rule refers to a column missing from the dataset.
+        """
+        dataset = self.handle.frame
+        missing_columns = sorted({rule.column for rule in self.rules} - set(dataset.columns))
+        if missing_columns:
+            raise ValueError(f"Missing columns in the dataset: {missing_columns}")
+
+        starts = range(0, max(len(dataset), 1), chunk_size)
+        columns = list(dict.fromkeys(rule.column for rule in self.rules))
+        chunks = [dataset.iloc[start:start + chunk_size][columns] for start in starts]
+        if n_jobs > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=min(n_jobs, len(chunks))) as executor:
+                results = list(executor.map(_check_chunk, repeat(self.rules), chunks))
+        else:
+            results = [_check_chunk(self.rules, chunk) for chunk in chunks]
+
+        positions = np.concatenate([result[0] + start for start, result in zip(starts, results)])
+        rule_ids = np.concatenate([result[1] for result in results])
+        failed = np.concatenate([result[2] for result in results])
+
+        order = np.lexsort((rule_ids, positions))
+        positions, rule_ids = positions[order], rule_ids[order]
+        self.errors = pd.DataFrame(
+            {
+                "row": dataset.index[positions],
+                "column": self._labels(rule_ids, "column"),
+                "rule": self._labels(rule_ids, "name"),
+                "severity": self._labels(rule_ids, "severity"),
+            }
+        )
+
+        valid = as_handle(dataset)
+        valid.filter_rows(pd.Series(~failed, index=dataset.index))
+        self.valid_dataset = valid.frame
+        self.quarantined_dataset = dataset[failed]
+        return self.valid_dataset
+
+    def error_summary(self):
+        """
+        Returns the number of failed checks per column and rule.
+
+        Returns:
+        -------
+        DataFrame
+            The counts, with 'column', 'rule', 'severity' and 'count' columns.
+        """
+        if self.errors is None:
+            raise ValueError("Dataset not validated. Use validate() method first.")
+        return (
+            self.errors.groupby(["column", "rule", "severity"], observed=True)
+            .size()
+            .reset_index(name="count")
+        )
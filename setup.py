@@ -1,4 +1,4 @@
-from distutils.core import setup
+from setuptools import setup
 
 setup(
     name="building_analysis",
@@ -9,10 +9,13 @@ setup(
     license="MIT",
     url="",
     packages=["building_analysis"],
+    entry_points={
+        "console_scripts": ["building-analysis=building_analysis.cli:main"],
+    },
     install_requires=[
         "matplotlib>=3.0.2",
         "numpy>=1.15.2",
-        "pandas>=0.23.4",
+        "pandas>=1.5",
         "pandas-datareader>=0.7.0",
         "seaborn>=0.11.0",
         "statsmodels>=0.11.1",